@@ -0,0 +1,309 @@
+import time
+import json
+import logging
+import argparse
+import threading
+import os
+import random
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import rera_scraper
+from rera_scraper import EnhancedOdishaRERAScaper, CrawlMetrics, has_missing_fields, process_tree_pss_mb
+
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_PER_PAGE = 10
+RSS_SAMPLE_SECONDS = 0.05
+
+LISTING_PATH = "/projects/project-list"
+DETAIL_PATH = "/projects/project-details/"
+
+LISTING_TEMPLATE = """<html><head><title>Project List</title></head><body>
+<h1>Project List</h1>
+<table class="table"><thead><tr><th>RERA Regd. No</th><th>Project</th><th>Status</th><th></th></tr></thead>
+<tbody>{rows}</tbody></table>
+<ul class="pagination">{pagination}</ul>
+</body></html>"""
+
+LISTING_ROW_TEMPLATE = ("<tr><td>{rera}</td><td>{name}</td><td>Approved</td>"
+                        "<td><a class=\"btn\" href=\"{detail_path}{number}\">View Details</a></td></tr>")
+
+DETAIL_TEMPLATE = """<html><head><title>Project Details</title>
+<style>.tab-pane {{ display: none; }} .tab-pane.active {{ display: block; }}</style></head><body>
+<h1>Project Details</h1>
+<ul class="nav nav-tabs">
+<li><a class="nav-link active" data-target="#overview" href="#overview" onclick="return showTab(this)">Project Overview</a></li>
+<li><a class="nav-link" data-target="#promoter" href="#promoter" onclick="return showTab(this)">Promoter Details</a></li>
+</ul>
+<div class="tab-content">
+<div class="tab-pane active" id="overview"><table class="table">
+<tr><td>Project Name</td><td>{name}</td></tr>
+<tr><td>RERA Regd. No</td><td>{rera}</td></tr>
+<tr><td>Project Type</td><td>Residential</td></tr></table>
+{filler}</div>
+<div class="tab-pane" id="promoter"><table class="table">
+<tr><td>Company Name</td><td>M/S. {promoter} INFRA PVT LTD</td></tr>
+<tr><td>Registered Office Address</td><td>Plot {number}, Saheed Nagar, Bhubaneswar, PIN-751007</td></tr>
+<tr><td>GST No</td><td>{gst}</td></tr></table></div>
+</div>
+<script>
+function showTab(link) {{
+    document.querySelectorAll('.nav-link').forEach(function (tab) {{ tab.classList.remove('active'); }});
+    document.querySelectorAll('.tab-pane').forEach(function (pane) {{ pane.classList.remove('active'); }});
+    link.classList.add('active');
+    document.querySelector(link.getAttribute('data-target')).classList.add('active');
+    return false;
+}}
+</script>
+</body></html>"""
+
+PROJECT_NAMES = ['Enclave', 'Residency', 'Heights', 'Garden', 'Tower', 'Plaza']
+
+
+class MockReraSite:
+    """Synthetic Odisha-RERA-like site served from a background thread on localhost"""
+
+    def __init__(self, projects, per_page=DEFAULT_PER_PAGE, latency_ms=0, page_kb=0, error_rate=0.0):
+        self.projects = projects
+        self.per_page = per_page
+        self.latency = latency_ms / 1000
+        self.page_kb = page_kb
+        self.error_rate = error_rate
+        self.requests = 0
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    @staticmethod
+    def rera_number(number):
+        return f"RP/{number % 30 + 1:02d}/2025/{number:05d}"
+
+    def listing_page(self, page):
+        """HTML of one listing page with a rel=next link unless it is the last"""
+        first = (page - 1) * self.per_page + 1
+        last = min(self.projects, page * self.per_page)
+        rows = ''.join(LISTING_ROW_TEMPLATE.format(rera=self.rera_number(n), detail_path=DETAIL_PATH, number=n,
+                                                   name=f"Benchmark {PROJECT_NAMES[n % len(PROJECT_NAMES)]} {n}")
+                       for n in range(first, last + 1))
+        if last < self.projects:
+            pagination = f'<li class="next"><a rel="next" href="{LISTING_PATH}?page={page + 1}">Next</a></li>'
+        else:
+            pagination = '<li class="next disabled"><a href="#">Next</a></li>'
+        return LISTING_TEMPLATE.format(rows=rows, pagination=pagination)
+
+    def detail_page(self, number):
+        """HTML of one project's detail page, padded to roughly page_kb"""
+        filler = '<p class="filler">' + 'Lorem ipsum dolor sit amet. ' * 36 + '</p>'
+        return DETAIL_TEMPLATE.format(number=number, rera=self.rera_number(number),
+                                      name=f"Benchmark {PROJECT_NAMES[number % len(PROJECT_NAMES)]} {number}",
+                                      promoter=f"BENCH{number}", gst=f"21AAACB{number % 10000:04d}A1Z{number % 10}",
+                                      filler=filler * self.page_kb)
+
+    def render(self, path):
+        """(status, body) for a request path"""
+        url = urlparse(path)
+        if self.error_rate and random.random() < self.error_rate:
+            return 503, "<html><body>Service Unavailable</body></html>"
+        if url.path == LISTING_PATH:
+            page = int(parse_qs(url.query).get('page', ['1'])[0])
+            return 200, self.listing_page(page)
+        if url.path.startswith(DETAIL_PATH):
+            number = url.path[len(DETAIL_PATH):]
+            if number.isdigit() and 1 <= int(number) <= self.projects:
+                return 200, self.detail_page(int(number))
+        return 404, "<html><body>Not Found</body></html>"
+
+    def start(self):
+        """Serve on an ephemeral port until stop()"""
+        site = self
+
+        class MockHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if site.latency:
+                    time.sleep(site.latency)
+                status, body = site.render(self.path)
+                body = body.encode('utf-8')
+                with site.lock:
+                    site.requests += 1
+                    site.bytes_sent += len(body)
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), MockHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="mock-rera-site", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+class PeakRssSampler:
+    """Sample the memory (PSS) of this process and its children (Chrome included) in the background"""
+
+    def __init__(self, interval=RSS_SAMPLE_SECONDS):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def sample(self):
+        self.peak_mb = max(self.peak_mb, process_tree_pss_mb(os.getpid()))
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def __enter__(self):
+        self.sample()
+        self.thread = threading.Thread(target=self.run, name="rss-sampler", daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+        self.sample()
+
+
+def run_benchmark(projects, mode, args):
+    """Scrape a fresh mock site of the given size end to end and return the measurements"""
+    site = MockReraSite(projects, per_page=args.per_page, latency_ms=args.latency_ms, page_kb=args.page_kb,
+                        error_rate=args.error_rate).start()
+    metrics = CrawlMetrics()
+    try:
+        scraper = EnhancedOdishaRERAScaper(args.chromedriver, workers=args.workers, max_projects=projects,
+                                           fetch_mode=mode, rate_limit=args.rate, max_in_flight=args.max_in_flight,
+                                           metrics=metrics, lean=args.lean)
+        scraper.base_url = site.base_url + LISTING_PATH
+
+        with PeakRssSampler() as sampler:
+            start = time.perf_counter()
+            success = scraper.scrape_projects()
+            elapsed = time.perf_counter() - start
+    finally:
+        site.stop()
+
+    records = [record for record in scraper.projects_data if record]
+    project_timing = next((timing for timing in metrics.report()['timings']
+                           if timing['stage'] == 'project' and not timing['labels']), {})
+    return {
+        # Lean browsers are tracked separately so baselines compare like with like
+        'mode': f"{mode}-lean" if args.lean and mode != 'http' else mode,
+        'projects': projects,
+        'success': bool(success),
+        'complete_records': sum(1 for record in records if not has_missing_fields(record)),
+        'elapsed_seconds': round(elapsed, 3),
+        'pages': site.requests,
+        'pages_per_sec': round(site.requests / elapsed, 2) if elapsed else 0.0,
+        'projects_per_sec': round(len(records) / elapsed, 2) if elapsed else 0.0,
+        'mb_served': round(site.bytes_sent / 1024 / 1024, 2),
+        'project_p50_seconds': project_timing.get('p50_seconds', 0.0),
+        'project_p90_seconds': project_timing.get('p90_seconds', 0.0),
+        'project_p99_seconds': project_timing.get('p99_seconds', 0.0),
+        'peak_rss_mb': round(sampler.peak_mb, 1),
+    }
+
+
+def compare_to_baseline(results, baseline_path, tolerance):
+    """Regressions against a previous results file: throughput down or p90 latency up by more than tolerance"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(entry['mode'], entry['projects']): entry for entry in json.load(f)}
+
+    regressions = []
+    for result in results:
+        previous = baseline.get((result['mode'], result['projects']))
+        if not previous:
+            continue
+        if result['pages_per_sec'] < previous['pages_per_sec'] * (1 - tolerance):
+            regressions.append(f"{result['mode']}/{result['projects']}: pages/sec "
+                               f"{previous['pages_per_sec']} -> {result['pages_per_sec']}")
+        if previous['project_p90_seconds'] and \
+                result['project_p90_seconds'] > previous['project_p90_seconds'] * (1 + tolerance):
+            regressions.append(f"{result['mode']}/{result['projects']}: p90 latency "
+                               f"{previous['project_p90_seconds']}s -> {result['project_p90_seconds']}s")
+    return regressions
+
+
+def print_results(results):
+    """Print one row per benchmark run"""
+    print("\n" + "=" * 109)
+    print(f"{'MODE':<13}{'PROJECTS':>9}{'COMPLETE':>10}{'SECONDS':>10}{'PAGES':>8}{'PAGES/S':>10}"
+          f"{'P50 S':>9}{'P90 S':>9}{'P99 S':>9}{'PEAK RSS MB':>13}{'MB SERVED':>11}")
+    print("=" * 109)
+    for r in results:
+        print(f"{r['mode']:<13}{r['projects']:>9}{r['complete_records']:>10}{r['elapsed_seconds']:>10.2f}"
+              f"{r['pages']:>8}{r['pages_per_sec']:>10.1f}{r['project_p50_seconds']:>9.3f}"
+              f"{r['project_p90_seconds']:>9.3f}{r['project_p99_seconds']:>9.3f}{r['peak_rss_mb']:>13.1f}"
+              f"{r['mb_served']:>11.2f}")
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark the Odisha RERA scraper against a local mock site")
+    parser.add_argument("--sizes", type=int, nargs='+', default=DEFAULT_SIZES, help="Project counts to benchmark")
+    parser.add_argument("--modes", nargs='+', choices=['http', 'auto', 'browser'], default=['http'],
+                        help="Fetch modes to compare (browser needs --chromedriver)")
+    parser.add_argument("--chromedriver", default="chromedriver", help="Path to the chromedriver binary")
+    parser.add_argument("--workers", type=int, default=1, help="Browser workers for browser mode")
+    parser.add_argument("--lean", action="store_true",
+                        help="Use lean headless, memory-capped browser sessions (reported as <mode>-lean)")
+    parser.add_argument("--per-page", type=int, default=DEFAULT_PER_PAGE, help="Projects per listing page")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Simulated server latency per request")
+    parser.add_argument("--page-kb", type=int, default=40, help="Approximate size of each detail page")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Share of requests answered with 503 to simulate a flaky server")
+    parser.add_argument("--rate", type=float, default=0, help="Scraper rate limit (0 = unlimited, as in the default run)")
+    parser.add_argument("--max-in-flight", type=int, default=rera_scraper.DEFAULT_MAX_IN_FLIGHT,
+                        help="Concurrent HTTP detail fetches")
+    parser.add_argument("--output", default="benchmark_results.json", metavar="FILE", help="Where to write results")
+    parser.add_argument("--baseline", metavar="FILE", help="Previous results to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed fractional slowdown against the baseline before failing")
+    parser.add_argument("--verbose", action="store_true", help="Keep the scraper's per-field INFO logging")
+    return parser.parse_args()
+
+
+def main():
+    """Run every size in every mode, print a table and optionally check a baseline"""
+    args = parse_args()
+    if not args.verbose:
+        rera_scraper.logger.setLevel(logging.WARNING)
+
+    print("🏁 Odisha RERA Scraper Benchmark")
+    results = []
+    for mode in args.modes:
+        for projects in args.sizes:
+            print(f"⏱️ {mode} mode, {projects} projects...")
+            results.append(run_benchmark(projects, mode, args))
+
+    print_results(results)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n📁 Results saved to {args.output}")
+
+    if args.baseline:
+        regressions = compare_to_baseline(results, args.baseline, args.tolerance)
+        for regression in regressions:
+            print(f"❌ Regression: {regression}")
+        if regressions:
+            raise SystemExit(1)
+        print("✅ No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 import time
 import pandas as pd
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -7,11 +12,57 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, WebDriverException,
+                                        StaleElementReferenceException, InvalidSessionIdException)
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 import logging
+import csv
 import json
+import os
+import functools
+import re
+import hashlib
+import heapq
+import random
+import math
+import gzip
+import zlib
+import mmap
+import asyncio
+import copy
+import argparse
+import threading
+import socket
+import sqlite3
+import contextlib
+import collections
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,168 +74,2420 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+FIELDS = ['Rera Regd. No', 'Project Name', 'Promoter Name', 'Address of the Promoter', 'GST No']
+
+# Rough resident memory of one Chrome session, used to cap the worker pool
+DRIVER_MEMORY_MB = 400
+
+# Lean sessions: headless, no GPU or background services, a capped JS heap and a small window
+LEAN_JS_HEAP_MB = 256
+LEAN_WINDOW_SIZE = "1024,768"
+LEAN_CHROME_ARGUMENTS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    f"--js-flags=--max-old-space-size={LEAN_JS_HEAP_MB}",
+    f"--window-size={LEAN_WINDOW_SIZE}",
+]
+# Worker pools are sized from a session's measured memory times this, to leave room for growth
+SESSION_MEMORY_HEADROOM = 1.5
+
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# Registration numbers as printed on the listing, e.g. RP/01/2025/01362
+RERA_NUMBER_PATTERN = re.compile(r'\b[A-Z]{2,3}/\d{1,2}/\d{4}/\d{3,6}\b')
+
+# Listing row (table row or card) that holds a project's View Details link
+LISTING_ROW_XPATH = "./ancestor::tr[1] | ./ancestor::*[contains(@class, 'card')][1]"
+
+# Politeness budget: sustained requests per second per host, and concurrent HTTP fetches
+DEFAULT_RATE_LIMIT = 1.0
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Resource types dropped by default; stylesheets are kept because visibility checks depend on them
+DEFAULT_BLOCKED_RESOURCE_TYPES = ['image', 'font', 'media']
+
+# URL patterns (Chrome wildcard syntax) per resource type, used with Network.setBlockedURLs
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.svg*', '*.webp*', '*.ico*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.mp3*', '*.ogg*'],
+    'stylesheet': ['*.css*'],
+}
+
+# Analytics and third-party scripts never needed for extraction
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*facebook.net*', '*hotjar.com*', '*clarity.ms*', '*addthis.com*'
+]
+
+# Percentiles are computed over the most recent samples of each timing series
+METRICS_MAX_SAMPLES = 10000
+METRICS_QUANTILES = (0.5, 0.9, 0.99)
+
+# Page cache eviction runs after this many writes
+PAGE_CACHE_EVICT_EVERY = 100
+
+# Selector ranking weighs roughly the last 50 attempts of each selector (older ones decay away)
+SELECTOR_STATS_DECAY = 0.98
+
+# Failure kinds worth another attempt, and the ones that suggest the server is struggling
+RETRYABLE_FAILURES = {'timeout', 'stale_element', 'navigation', 'empty_extraction', 'driver_crash',
+                      'server_error', 'network'}
+OVERLOAD_FAILURES = {'timeout', 'server_error', 'network'}
+DEFAULT_MAX_ATTEMPTS_PER_PROJECT = 3
+DEFAULT_RETRY_BASE_DELAY = 2.0
+MAX_RETRY_DELAY = 60.0
+
+# Concurrency is halved when more than this share of recent fetches overloads the server,
+# and raised by one after a window of clean fetches
+ADAPTIVE_WINDOW = 20
+ADAPTIVE_ERROR_THRESHOLD = 0.25
+
+# Shared work queue: how long a claimed project stays leased, idle poll interval
+DEFAULT_LEASE_SECONDS = 600
+QUEUE_POLL_SECONDS = 5
+
+# A pooled browser session is restarted after this many pages or this much memory growth
+DEFAULT_SESSION_MAX_PAGES = 200
+DEFAULT_SESSION_MAX_RSS_GROWTH_MB = 600
+
+# Per-condition readiness timeouts in seconds
+READINESS_TIMEOUTS = {
+    'document': 15,
+    'element': 10,
+    'loading_indicator': 5,
+    'network_idle': 5,
+    'dom_quiet': 3,
+    'navigation': 5,
+    'tab_pane': 5,
+}
+
+# How long the network / DOM must stay still before the page counts as settled
+QUIET_PERIOD_MS = 300
+
+NEXT_PAGE_SELECTORS = [
+    "//a[@rel='next']",
+    "//a[contains(@aria-label, 'Next')]",
+    "//li[contains(@class, 'next')]/a",
+    "//a[normalize-space(text())='Next' or normalize-space(text())='»' or normalize-space(text())='›']",
+    "//button[contains(text(), 'Next')]",
+    ".pagination .next a", ".page-item.next a"
+]
+
+VIEW_DETAILS_SELECTORS = [
+    # XPath strategies
+    "//a[contains(text(), 'View Details')]",
+    "//button[contains(text(), 'View Details')]",
+    "//a[contains(text(), 'View')]",
+    "//input[@value='View Details']",
+    "//a[contains(@onclick, 'view') or contains(@onclick, 'detail')]",
+
+    # CSS strategies
+    "a[href*='view']",
+    "a[href*='detail']",
+    ".view-btn", ".detail-btn", ".btn-view",
+    "button[onclick*='view']"
+]
+
+# More comprehensive tab selectors including variations
+PROMOTER_TAB_SELECTORS = [
+    "//a[contains(text(), 'Promoter Details')]",
+    "//a[contains(text(), 'Promoter')]",
+    "//button[contains(text(), 'Promoter Details')]",
+    "//button[contains(text(), 'Promoter')]",
+    "//li[contains(text(), 'Promoter Details')]",
+    "//li[contains(text(), 'Promoter')]",
+    "//span[contains(text(), 'Promoter Details')]",
+    "//span[contains(text(), 'Promoter')]",
+    "//*[@id='promoter-tab']",
+    "//*[@href='#promoter']",
+    "//*[@href='#promoter-details']",
+    "//*[contains(@class, 'promoter')]",
+    "a[href*='promoter']",
+    ".nav-link[href*='promoter']",
+    "#promoter-tab",
+    ".tab[data-target*='promoter']",
+    "button[data-toggle='tab'][href*='promoter']"
+]
+
+# Field selectors, evaluated in order until one yields a usable value
+RERA_SELECTORS = [
+    "//td[contains(text(), 'RERA Registration No') or contains(text(), 'RERA Regd. No') or contains(text(), 'Registration No')]/following-sibling::td[1]",
+    "//th[contains(text(), 'RERA Registration No') or contains(text(), 'RERA Regd. No') or contains(text(), 'Registration No')]/following-sibling::td[1]",
+    "//tr[td[contains(text(), 'RERA Registration No') or contains(text(), 'RERA Regd. No') or contains(text(), 'Registration No')]]/td[2]",
+    "//label[contains(text(), 'RERA')]/following-sibling::*[1]",
+    "//strong[contains(text(), 'RERA')]/parent::*/following-sibling::*[1]",
+    "//*[contains(@class, 'rera-no')]",
+    "//*[@id='rera_no' or @id='registration_no']",
+    ".registration-number", ".rera-number"
+]
+
+NAME_SELECTORS = [
+    # Look in table cells first
+    "//td[contains(text(), 'Project Name')]/following-sibling::td[1]",
+    "//th[contains(text(), 'Project Name')]/following-sibling::td[1]",
+    "//tr[td[contains(text(), 'Project Name')]]/td[2]",
+
+    # Look for headings that are NOT numbers and NOT generic terms
+    "//h1[not(contains(text(), 'RERA')) and not(contains(text(), 'Project List')) and not(contains(text(), 'Projects')) and not(number(text())=text())]",
+    "//h2[not(contains(text(), 'RERA')) and not(contains(text(), 'Project List')) and not(contains(text(), 'Projects')) and not(number(text())=text())]",
+    "//h3[not(contains(text(), 'RERA')) and not(contains(text(), 'Project List')) and not(contains(text(), 'Projects')) and not(number(text())=text())]",
+
+    "//*[contains(@class, 'project-name')]",
+    "//*[@id='project_name']",
+    ".project-title", ".project-heading"
+]
+
+# Handles both "Promoter Name" and "Proprietory Name"
+PROMOTER_SELECTORS = [
+    "//td[contains(text(), 'Company Name') or contains(text(), 'Promoter Name') or contains(text(), 'Proprietory Name') or contains(text(), 'Propietory Name') or contains(text(), 'Firm Name')]/following-sibling::td[1]",
+    "//th[contains(text(), 'Company Name') or contains(text(), 'Promoter Name') or contains(text(), 'Proprietory Name') or contains(text(), 'Propietory Name')]/following-sibling::td[1]",
+    "//tr[td[contains(text(), 'Company Name') or contains(text(), 'Promoter Name') or contains(text(), 'Proprietory Name') or contains(text(), 'Propietory Name')]]/td[2]",
+    "//label[contains(text(), 'Company') or contains(text(), 'Promoter') or contains(text(), 'Proprietory') or contains(text(), 'Propietory')]/following-sibling::*[1]",
+    "//*[contains(@class, 'promoter-name') or contains(@class, 'company-name')]",
+    "//*[@id='company_name' or @id='promoter_name']",
+    ".company-name", ".promoter-name", ".firm-name"
+]
+
+ADDRESS_SELECTORS = [
+    "//td[contains(text(), 'Registered Office') or contains(text(), 'Address') or contains(text(), 'Office Address')]/following-sibling::td[1]",
+    "//th[contains(text(), 'Registered Office') or contains(text(), 'Address')]/following-sibling::td[1]",
+    "//tr[td[contains(text(), 'Registered Office') or contains(text(), 'Address')]]/td[2]",
+    "//label[contains(text(), 'Registered Office') or contains(text(), 'Address')]/following-sibling::*[1]",
+    "//*[contains(@class, 'promoter-address') or contains(@class, 'office-address')]",
+    "//*[@id='registered_address' or @id='office_address']",
+    ".registered-address", ".office-address", ".promoter-address"
+]
+
+GST_SELECTORS = [
+    "//td[contains(text(), 'GST') or contains(text(), 'GSTIN')]/following-sibling::td[1]",
+    "//th[contains(text(), 'GST') or contains(text(), 'GSTIN')]/following-sibling::td[1]",
+    "//tr[td[contains(text(), 'GST') or contains(text(), 'GSTIN')]]/td[2]",
+    "//label[contains(text(), 'GST') or contains(text(), 'GSTIN')]/following-sibling::*[1]",
+    "//*[contains(@class, 'gst-number') or contains(@class, 'gstin')]",
+    "//*[@id='gst_no' or @id='gstin']",
+    ".gst-number", ".gstin"
+]
+
+# Words that mark a project name anywhere on the page; portal profiles add their own known names
+PROJECT_NAME_KEYWORDS = ['Enclave', 'Residency', 'Manor', 'Villa', 'Heights', 'Park', 'Garden', 'Tower', 'Plaza',
+                         'City', 'Colony']
+ODISHA_PROJECT_NAMES = ['UDYAYEEN', 'BARSANA', 'KRISHNA', 'BHAVYAVILLA']
+
+
+def name_keyword_selector(keywords):
+    """XPath matching any element whose text contains one of the keywords"""
+    return "//*[" + " or ".join(f"contains(text(), '{keyword}')" for keyword in keywords) + "]"
+
+
+FIELD_SELECTORS = {
+    'Rera Regd. No': RERA_SELECTORS,
+    'Project Name': NAME_SELECTORS,
+    'Promoter Name': PROMOTER_SELECTORS,
+    'Address of the Promoter': ADDRESS_SELECTORS,
+    'GST No': GST_SELECTORS,
+}
+
+# Row labels that name each field in label/value tables, most specific first
+FIELD_LABELS = {
+    'Rera Regd. No': ['RERA Registration No', 'RERA Regd. No', 'Registration No'],
+    'Project Name': ['Project Name'],
+    'Promoter Name': ['Company Name', 'Promoter Name', 'Proprietory Name', 'Propietory Name', 'Firm Name'],
+    'Address of the Promoter': ['Registered Office Address', 'Registered Office', 'Office Address', 'Address'],
+    'GST No': ['GSTIN', 'GST No', 'GST'],
+}
+
+# Fields that live on the Promoter Details tab rather than the project overview
+PROMOTER_FIELDS = ['Promoter Name', 'Address of the Promoter', 'GST No']
+
+PLACEHOLDER_VALUES = ['not available', 'n/a', '-', '']
+
+# Runs of commas (and the blanks between them) the site leaves where address parts are empty
+REPEATED_COMMAS = r'\s*,(?:\s*,)+'
+
+# Registration number pieces, tolerating stray spaces, dashes and backslashes as separators
+RERA_NUMBER_PARTS = r'([A-Z]{2,3})\s*[/\\-]\s*(\d{1,2})\s*[/\\-]\s*(\d{4})\s*[/\\-]\s*(\d{3,6})'
+
+# 15-character GSTIN: state code, PAN, entity number, 'Z', check character
+GSTIN_PATTERN = r'^\d{2}[A-Z]{5}\d{4}[A-Z][1-9A-Z]Z[0-9A-Z]$'
+GSTIN_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Legal-form spellings folded together when matching promoters
+PROMOTER_SUFFIXES = [
+    (r'\bPRIVATE\b', 'PVT'),
+    (r'\bLIMITED\b', 'LTD'),
+    (r'\bPVT\.?\s*LTD\.?', 'PVT LTD'),
+    (r'\bCOMPANY\b', 'CO'),
+    (r'&', 'AND'),
+]
+
+# Pre-rendered (possibly hidden) Bootstrap pane holding the promoter details
+PROMOTER_PANE_XPATH = ("//*[contains(@class, 'tab-pane') and "
+                       "contains(translate(@id, 'PROMOTER', 'promoter'), 'promoter')]")
+
+# Present once a detail page has rendered: the promoter pane or the tab that opens it
+DETAIL_READY_XPATH = (PROMOTER_PANE_XPATH + " | //*[self::a or self::button or self::li]"
+                      "[contains(translate(normalize-space(.), 'PROMOTER', 'promoter'), 'promoter')]")
+
+# Collects every label/value pair on the page in one call, grouped by the tab pane holding it.
+# textContent is used so panes hidden behind inactive tabs are read too.
+LABEL_VALUE_JS = """
+var sections = {};
+function clean(text) { return (text || '').replace(/\\s+/g, ' ').trim(); }
+function sectionOf(node) {
+    var pane = node.closest('.tab-pane');
+    return pane && pane.id ? pane.id : 'page';
+}
+function add(node, label, value) {
+    label = clean(label).replace(/[:*\\s]+$/, '');
+    value = clean(value);
+    if (!label || !value || label.length > 80) return;
+    var section = sections[sectionOf(node)] = sections[sectionOf(node)] || {};
+    if (!(label in section)) section[label] = value;
+}
+document.querySelectorAll('tr').forEach(function (row) {
+    var cells = Array.prototype.filter.call(row.children, function (cell) {
+        return cell.tagName === 'TD' || cell.tagName === 'TH';
+    });
+    if (cells.every(function (cell) { return cell.tagName === 'TH'; })) return;
+    for (var i = 0; i + 1 < cells.length; i += 2) add(row, cells[i].textContent, cells[i + 1].textContent);
+});
+document.querySelectorAll('dt').forEach(function (term) {
+    var next = term.nextElementSibling;
+    if (next && next.tagName === 'DD') add(term, term.textContent, next.textContent);
+});
+document.querySelectorAll('label').forEach(function (label) {
+    var next = label.nextElementSibling;
+    if (next) add(label, label.textContent, next.value || next.textContent);
+});
+return sections;
+"""
+
+LOADING_SELECTORS = ".loading, .spinner, [class*='loading'], .loader, [class*='loader'], #loading"
+
+# Tracks in-flight XHR/fetch calls and the time of the last DOM mutation
+READINESS_PROBE_JS = """
+if (!window.__reraProbe) {
+    window.__reraProbe = {pending: 0, lastMutation: performance.now()};
+    var probe = window.__reraProbe;
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        probe.pending++;
+        this.addEventListener('loadend', function() { probe.pending--; });
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var nativeFetch = window.fetch;
+        window.fetch = function() {
+            probe.pending++;
+            return nativeFetch.apply(this, arguments).finally(function() { probe.pending--; });
+        };
+    }
+    new MutationObserver(function() { probe.lastMutation = performance.now(); })
+        .observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+"""
+
+NETWORK_STATE_JS = """
+var probe = window.__reraProbe || {pending: 0};
+var jq = window.jQuery ? window.jQuery.active : 0;
+return [probe.pending + jq, performance.getEntriesByType('resource').length, performance.now()];
+"""
+
+DOM_IDLE_MS_JS = """
+var probe = window.__reraProbe;
+return probe ? performance.now() - probe.lastMutation : null;
+"""
+
+LOADING_VISIBLE_JS = """
+return Array.prototype.some.call(document.querySelectorAll(arguments[0]), function(el) {
+    return el.offsetParent !== null;
+});
+"""
+
+
+class network_idle:
+    """Expected condition: no pending requests and no new resources for the quiet period"""
+
+    def __init__(self, quiet_ms=QUIET_PERIOD_MS):
+        self.quiet_ms = quiet_ms
+        self.last_count = None
+        self.stable_since = None
+
+    def __call__(self, driver):
+        pending, count, now = driver.execute_script(NETWORK_STATE_JS)
+        if pending > 0 or count != self.last_count:
+            self.last_count = count
+            self.stable_since = now
+            return False
+        return now - self.stable_since >= self.quiet_ms
+
+
+class dom_quiescent:
+    """Expected condition: no DOM mutations observed for the quiet period"""
+
+    def __init__(self, quiet_ms=QUIET_PERIOD_MS):
+        self.quiet_ms = quiet_ms
+
+    def __call__(self, driver):
+        idle_ms = driver.execute_script(DOM_IDLE_MS_JS)
+        return idle_ms is None or idle_ms >= self.quiet_ms
+
+
+class CrawlMetrics:
+    """Thread-safe stage timers and event counters for a crawl.
+
+    Timings keep an exact count and sum plus a bounded window of recent samples
+    for percentiles. The same data can be logged, written as a JSON run report
+    or exposed in Prometheus text format.
+    """
+
+    def __init__(self, max_samples=METRICS_MAX_SAMPLES):
+        self.max_samples = max_samples
+        self.timings = {}
+        self.counters = collections.Counter()
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+
+    @staticmethod
+    def series(name, labels):
+        # Label values are strings, as in Prometheus, so series with mixed value types still sort
+        return (name, tuple(sorted((key, str(value)) for key, value in labels.items())))
+
+    def observe(self, stage, seconds, **labels):
+        """Record one timing for a stage"""
+        key = self.series(stage, labels)
+        with self.lock:
+            if key not in self.timings:
+                self.timings[key] = {'count': 0, 'sum': 0.0, 'max': 0.0,
+                                     'samples': collections.deque(maxlen=self.max_samples)}
+            entry = self.timings[key]
+            entry['count'] += 1
+            entry['sum'] += seconds
+            entry['max'] = max(entry['max'], seconds)
+            entry['samples'].append(seconds)
+
+    def increment(self, name, amount=1, **labels):
+        """Count an event such as a timeout, retry or fallback"""
+        with self.lock:
+            self.counters[self.series(name, labels)] += amount
+
+    @contextlib.contextmanager
+    def timer(self, stage, **labels):
+        """Time the enclosed block, whether or not it raises"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    @staticmethod
+    def percentile(sorted_values, quantile):
+        """Nearest-rank percentile of an already sorted list"""
+        if not sorted_values:
+            return 0.0
+        rank = max(0, min(len(sorted_values) - 1, math.ceil(quantile * len(sorted_values)) - 1))
+        return sorted_values[rank]
+
+    def report(self):
+        """Snapshot of every timing (with percentiles) and counter as plain data"""
+        with self.lock:
+            timings = [(name, labels, dict(entry, samples=sorted(entry['samples'])))
+                       for (name, labels), entry in self.timings.items()]
+            counters = list(self.counters.items())
+
+        report = {'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+                  'elapsed_seconds': round(time.time() - self.started_at, 3), 'timings': [], 'counters': []}
+        for name, labels, entry in sorted(timings):
+            timing = {'stage': name, 'labels': dict(labels), 'count': entry['count'],
+                      'total_seconds': round(entry['sum'], 4), 'max_seconds': round(entry['max'], 4)}
+            for quantile in METRICS_QUANTILES:
+                timing[f"p{int(quantile * 100)}_seconds"] = round(self.percentile(entry['samples'], quantile), 4)
+            report['timings'].append(timing)
+        for (name, labels), value in sorted(counters):
+            report['counters'].append({'name': name, 'labels': dict(labels), 'value': value})
+        return report
+
+    def save_json(self, path):
+        """Write the run report; returns False if it could not be written"""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, indent=2)
+            logger.info(f"📈 Metrics report saved to {path}")
+            return True
+        except OSError as e:
+            logger.error(f"❌ Error saving metrics report: {str(e)}")
+            return False
+
+    def prometheus_text(self):
+        """Render timings as summaries and counters as counters in Prometheus exposition format"""
+        def label_text(labels, **extra):
+            pairs = list(labels.items()) + list(extra.items())
+            if not pairs:
+                return ''
+            escaped = [(key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+                       for key, value in pairs]
+            return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+        report = self.report()
+        lines = []
+        stages = sorted({timing['stage'] for timing in report['timings']})
+        for stage in stages:
+            metric = f"rera_{stage}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for timing in report['timings']:
+                if timing['stage'] != stage:
+                    continue
+                for quantile in METRICS_QUANTILES:
+                    value = timing[f"p{int(quantile * 100)}_seconds"]
+                    lines.append(f"{metric}{label_text(timing['labels'], quantile=quantile)} {value}")
+                lines.append(f"{metric}_sum{label_text(timing['labels'])} {timing['total_seconds']}")
+                lines.append(f"{metric}_count{label_text(timing['labels'])} {timing['count']}")
+        for name in sorted({counter['name'] for counter in report['counters']}):
+            metric = f"rera_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for counter in report['counters']:
+                if counter['name'] == name:
+                    lines.append(f"{metric}{label_text(counter['labels'])} {counter['value']}")
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port):
+        """Expose /metrics in Prometheus text format from a background thread"""
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('', port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, name="rera-metrics", daemon=True).start()
+        logger.info(f"📈 Serving Prometheus metrics on http://localhost:{port}/metrics")
+        return server
+
+    def log_summary(self, stages=None):
+        """Log count, total and percentiles per stage, then every counter"""
+        report = self.report()
+        for timing in report['timings']:
+            if stages and timing['stage'] not in stages:
+                continue
+            labels = ''.join(f" {key}={value}" for key, value in timing['labels'].items())
+            logger.info(f"⏱️ {timing['stage']}{labels}: {timing['count']} x, {timing['total_seconds']:.1f}s total, "
+                        f"p50 {timing['p50_seconds']:.2f}s, p90 {timing['p90_seconds']:.2f}s, "
+                        f"p99 {timing['p99_seconds']:.2f}s")
+        for counter in report['counters']:
+            labels = ''.join(f" {key}={value}" for key, value in counter['labels'].items())
+            logger.info(f"🔢 {counter['name']}{labels}: {counter['value']}")
+
+
+def timed(stage):
+    """Decorator timing a scraper method under its instance's metrics"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.timer(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def classify_failure(error):
+    """Map an exception from Selenium or requests to a failure kind"""
+    if isinstance(error, (TimeoutException, requests.Timeout)):
+        return 'timeout'
+    if isinstance(error, StaleElementReferenceException):
+        return 'stale_element'
+    if isinstance(error, InvalidSessionIdException):
+        return 'driver_crash'
+    if isinstance(error, (requests.exceptions.RetryError, requests.HTTPError)):
+        status = getattr(error.response, 'status_code', None)
+        return 'client_error' if status and 400 <= status < 500 and status != 429 else 'server_error'
+    if isinstance(error, requests.ConnectionError):
+        return 'network'
+    if isinstance(error, WebDriverException):
+        message = str(error).lower()
+        if 'session' in message or 'disconnected' in message or 'crash' in message:
+            return 'driver_crash'
+        return 'navigation'
+    return 'unknown'
+
+
+class RetryPolicy:
+    """Which failures are retried, how many times, and exponential backoff with full jitter between attempts"""
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS_PER_PROJECT, base_delay=DEFAULT_RETRY_BASE_DELAY,
+                 max_delay=MAX_RETRY_DELAY):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, kind, attempt):
+        return kind in RETRYABLE_FAILURES and attempt < self.max_attempts
+
+    def delay(self, attempt):
+        """Seconds to wait before the attempt after `attempt`"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class DeferredQueue:
+    """Thread-safe work queue where retried items only become available after their backoff delay.
+
+    pop() blocks until an item is ready and returns None once the queue is empty and
+    no popped item is still being worked on (it might be pushed back for a retry).
+    """
+
+    def __init__(self, items=()):
+        self.heap = []
+        self.sequence = 0
+        self.active = 0
+        self.condition = threading.Condition()
+        for item in items:
+            self.push(item)
+
+    def push(self, item, delay=0.0):
+        with self.condition:
+            heapq.heappush(self.heap, (time.monotonic() + delay, self.sequence, item))
+            self.sequence += 1
+            self.condition.notify_all()
+
+    def pop(self):
+        with self.condition:
+            while True:
+                if self.heap:
+                    wait = self.heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        self.active += 1
+                        return heapq.heappop(self.heap)[2]
+                    self.condition.wait(wait)
+                elif self.active:
+                    self.condition.wait()
+                else:
+                    return None
+
+    def done(self):
+        """Mark a popped item as finished (after pushing it back, if it is being retried)"""
+        with self.condition:
+            self.active -= 1
+            self.condition.notify_all()
+
+
+class AdaptiveConcurrency:
+    """Additive-increase / multiplicative-decrease cap on concurrent fetches, driven by server failures"""
+
+    def __init__(self, limit, min_limit=1, window=ADAPTIVE_WINDOW, error_threshold=ADAPTIVE_ERROR_THRESHOLD,
+                 metrics=None):
+        self.max_limit = max(limit, min_limit)
+        self.min_limit = min_limit
+        self.limit = self.max_limit
+        self.window = window
+        self.error_threshold = error_threshold
+        self.metrics = metrics or CrawlMetrics()
+        self.outcomes = collections.deque(maxlen=window)
+        self.clean_streak = 0
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def try_acquire(self):
+        """Take a slot if one is free under the current limit (for asyncio callers that poll)"""
+        with self.condition:
+            if self.in_flight >= self.limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self):
+        with self.condition:
+            while self.in_flight >= self.limit:
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def record(self, failure):
+        """Feed one outcome (None for success) into the error-rate window"""
+        with self.condition:
+            overloaded = failure in OVERLOAD_FAILURES
+            self.outcomes.append(overloaded)
+            self.clean_streak = 0 if overloaded else self.clean_streak + 1
+            errors = sum(self.outcomes)
+            if len(self.outcomes) >= 5 and errors / len(self.outcomes) > self.error_threshold \
+                    and self.limit > self.min_limit:
+                self.limit = max(self.min_limit, self.limit // 2)
+                self.outcomes.clear()
+                self.metrics.increment('concurrency_decreases')
+                logger.warning(f"🐢 Server error rate {errors}/{self.window} too high; concurrency down to {self.limit}")
+            elif self.clean_streak >= self.window and self.limit < self.max_limit:
+                self.limit += 1
+                self.clean_streak = 0
+                logger.info(f"🐇 Concurrency back up to {self.limit}")
+                self.condition.notify_all()
+
+
+class PageCache:
+    """On-disk page cache keyed by URL and tab state.
+
+    Pages are stored gzip-compressed with a JSON header line holding the URL,
+    tab and fetch time. Entries older than the TTL are ignored (except in replay
+    mode, which never touches the network), and the least recently used entries
+    are evicted once the cache grows past max_mb.
+    """
+
+    def __init__(self, directory, ttl_hours=24, max_mb=500, replay=False):
+        self.directory = directory
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = max_mb * 1024 * 1024
+        self.replay = replay
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, url, tab):
+        key = hashlib.sha256(f"{tab}\n{url}".encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key[:2], key + '.html.gz')
+
+    def contains(self, url, tab='main'):
+        """True if get() would return the page, i.e. it is cached and not expired"""
+        try:
+            with gzip.open(self.path(url, tab), 'rt', encoding='utf-8') as f:
+                header = json.loads(f.readline())
+        except (OSError, ValueError):
+            return False
+        return self.replay or time.time() - header.get('fetched_at', 0) <= self.ttl_seconds
+
+    def get(self, url, tab='main'):
+        """Cached HTML for a URL and tab, or None if missing or expired"""
+        path = self.path(url, tab)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                header = json.loads(f.readline())
+                if not self.replay and time.time() - header['fetched_at'] > self.ttl_seconds:
+                    raise KeyError('expired')
+                html = f.read()
+            os.utime(path)  # Access time for LRU eviction
+        except (OSError, ValueError, KeyError):
+            with self.lock:
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+        return html
+
+    def put(self, url, html, tab='main'):
+        """Store a page; evicts least recently used entries every so often"""
+        path = self.path(url, tab)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        header = json.dumps({'url': url, 'tab': tab, 'fetched_at': time.time()})
+        with gzip.open(temp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(header + "\n" + html)
+        os.replace(temp_path, path)
+        with self.lock:
+            self.writes += 1
+            due = self.writes % PAGE_CACHE_EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_mb"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def log_summary(self):
+        logger.info(f"🗄️ Page cache: {self.hits} hits, {self.misses} misses, {self.writes} pages stored"
+                    f"{' (replay)' if self.replay else ''}")
+
+
+class SnapshotArchive:
+    """Append-only archive of captured detail pages, one compressed entry per project.
+
+    Entries are zlib-compressed JSON holding the overview page, the promoter
+    pane as it was after its tab was opened, and page metadata. They are appended
+    to one data file, with their offsets in a JSON Lines index next to it, so
+    readers mmap the data file and decompress single entries without reading the
+    rest. A re-captured project gets a new entry and the index points at the
+    latest one; entries without an index line (a crash mid-write) are ignored.
+    Appends hold an exclusive file lock, so worker processes on several nodes
+    can share one archive on a filesystem with working locks.
+    """
+
+    MAGIC = b'RERASNAP1\n'
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.mapped = None
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.entries[entry['key']] = entry
+        with self.locked_append() as f:
+            if f.tell() == 0:
+                f.write(self.MAGIC)
+
+    @contextlib.contextmanager
+    def locked_append(self):
+        """The data file opened for appending, under an exclusive lock shared with other processes"""
+        with self.lock, open(self.path, 'ab') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0, os.SEEK_END)
+                yield f
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def put(self, key, main_html, promoter_html=None, url=None, source='browser', page=None, index=None):
+        """Compress and append one project's snapshot; page and index are its listing position"""
+        snapshot = {'key': key, 'url': url, 'source': source, 'captured_at': datetime.now().isoformat(),
+                    'page': page, 'index': index, 'main': main_html, 'promoter': promoter_html}
+        data = zlib.compress(json.dumps(snapshot, ensure_ascii=False).encode('utf-8'), 6)
+        with self.locked_append() as f:
+            offset = f.tell()
+            f.write(data)
+            f.flush()
+            entry = {'key': key, 'offset': offset, 'length': len(data), 'url': url, 'source': source,
+                     'captured_at': snapshot['captured_at'], 'page': page, 'index': index,
+                     'html_bytes': len(main_html) + len(promoter_html or '')}
+            # Still under the lock, so index lines from different processes never interleave
+            with open(self.index_path, 'a', encoding='utf-8') as index_file:
+                index_file.write(json.dumps(entry) + "\n")
+            self.entries[key] = entry
+
+    def get(self, key):
+        """The snapshot dict stored for a project, or None"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        with self.lock:
+            if self.mapped is None or len(self.mapped) < entry['offset'] + entry['length']:
+                if self.mapped is not None:
+                    self.mapped.close()
+                with open(self.path, 'rb') as f:
+                    self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            data = self.mapped[entry['offset']:entry['offset'] + entry['length']]
+        return json.loads(zlib.decompress(data))
+
+    @staticmethod
+    def listing_order(entry):
+        """Sort key: listing page and row, then capture order for entries without a position"""
+        page, index = entry.get('page'), entry.get('index')
+        return (page is None, page or 0, index is None, index or 0, entry['offset'])
+
+    def __iter__(self):
+        """Latest snapshot of every project, in listing order"""
+        for entry in sorted(self.entries.values(), key=self.listing_order):
+            yield self.get(entry['key'])
+
+    def log_summary(self):
+        html_bytes = sum(entry['html_bytes'] for entry in self.entries.values())
+        stored_bytes = sum(entry['length'] for entry in self.entries.values())
+        logger.info(f"🗜️ Snapshot archive {self.path}: {len(self.entries)} projects, "
+                    f"{html_bytes / 1024 / 1024:.1f}MB of HTML in {stored_bytes / 1024 / 1024:.1f}MB")
+
+    def close(self):
+        with self.lock:
+            if self.mapped is not None:
+                self.mapped.close()
+                self.mapped = None
+
+
+class HttpFetcher:
+    """Pooled keep-alive HTTP session for pages that do not need JavaScript"""
+
+    def __init__(self, pool_size=10, timeout=15, cache=None, metrics=None):
+        self.timeout = timeout
+        self.cache = cache
+        self.metrics = metrics or CrawlMetrics()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504]))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+
+    def cached(self, url):
+        """True if a fetch of this URL will be served from the page cache (so needs no rate limiting)"""
+        return bool(self.cache) and (self.cache.replay or self.cache.contains(url))
+
+    def fetch(self, url):
+        """Fetch a page; returns (text, None) or (None, failure kind) on any HTTP or network failure"""
+        if self.cache:
+            html = self.cache.get(url)
+            if html is not None or self.cache.replay:
+                return html, None if html is not None else 'navigation'
+
+        try:
+            with self.metrics.timer('http_fetch'):
+                response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+        except requests.RequestException as e:
+            kind = classify_failure(e)
+            self.metrics.increment('http_errors', kind=kind)
+            logger.warning(f"⚠️ HTTP fetch failed for {url} ({kind}): {str(e)}")
+            return None, kind
+
+        if self.cache:
+            self.cache.put(url, response.text)
+        return response.text, None
+
+
+class RateLimiter:
+    """Thread-safe token bucket per host; callers reserve a slot and sleep for the returned delay"""
+
+    def __init__(self, rate=DEFAULT_RATE_LIMIT, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def reserve(self, url):
+        """Take one token for the URL's host and return how long to wait before sending"""
+        if self.rate <= 0:
+            return 0.0
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            tokens, updated = self.buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate) - 1
+            self.buckets[host] = (tokens, now)
+        return max(0.0, -tokens / self.rate)
+
+    def wait(self, url):
+        """Block until a request to the URL's host fits in the budget"""
+        delay = self.reserve(url)
+        if delay:
+            time.sleep(delay)
+
+
+class ProgressJournal:
+    """Append-only JSONL log of finished projects, so a crashed crawl can resume where it stopped"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Return {project id: record} for every project already completed"""
+        completed = {}
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                    completed[entry['id']] = entry['record']
+                except (ValueError, KeyError):
+                    # A crash mid-write leaves at most one truncated line at the end
+                    logger.warning(f"⚠️ Skipping unreadable journal line {line_number} in {self.path}")
+        return completed
+
+    def reset(self):
+        """Start a fresh journal for a non-resumed run"""
+        with self.lock:
+            open(self.path, 'w', encoding='utf-8').close()
+
+    def append(self, project_id, record):
+        """Durably record one finished project"""
+        line = json.dumps({'id': project_id, 'completed_at': datetime.now().isoformat(), 'record': record},
+                          ensure_ascii=False)
+        with self.lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class RecordSink:
+    """Receives each finished record as soon as it is extracted"""
+
+    def write(self, record):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class CsvSink(RecordSink):
+    """Appends one CSV row per record"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=FIELDS, extrasaction='ignore')
+        self.writer.writeheader()
+
+    def write(self, record):
+        self.writer.writerow(record)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class JsonLinesSink(RecordSink):
+    """Appends one JSON object per line, so consumers can tail results during the crawl"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+# Column names used by the Parquet file and the project store
+STORE_COLUMNS = {
+    'Rera Regd. No': 'rera_number',
+    'Project Name': 'project_name',
+    'Promoter Name': 'promoter_name',
+    'Address of the Promoter': 'promoter_address',
+    'GST No': 'gst_number',
+}
+
+
+def typed_record(record):
+    """Record with placeholders as None plus derived typed columns, keyed by store column names"""
+    row = {column: (None if record.get(field) in ('Not Available', 'Error', None) else record[field])
+           for field, column in STORE_COLUMNS.items()}
+    # Canonical keys so stores from different runs and portals join on the same numbers
+    row['rera_number'] = canonical_rera_number(row['rera_number']) or row['rera_number']
+    year = re.search(r'/(\d{4})/', row['rera_number'] or '')
+    row['registration_year'] = int(year.group(1)) if year else None
+    row['complete'] = all(row[column] is not None for column in STORE_COLUMNS.values())
+    row['scraped_at'] = datetime.now().replace(microsecond=0)
+    return row
+
+
+class ParquetSink(RecordSink):
+    """Buffers records into typed Parquet row groups (requires pyarrow)"""
+
+    def __init__(self, path, row_group_size=1000):
+        if pa is None:
+            raise ImportError("pyarrow is required for Parquet output: pip install pyarrow")
+        self.path = path
+        self.row_group_size = row_group_size
+        # Placeholders become nulls; promoters repeat across projects, so they are dictionary encoded
+        self.schema = pa.schema([
+            ('rera_number', pa.string()),
+            ('project_name', pa.string()),
+            ('promoter_name', pa.dictionary(pa.int32(), pa.string())),
+            ('promoter_address', pa.string()),
+            ('gst_number', pa.string()),
+            ('registration_year', pa.int16()),
+            ('complete', pa.bool_()),
+            ('scraped_at', pa.timestamp('s')),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema, compression='zstd')
+        self.buffer = []
+
+    def write(self, record):
+        self.buffer.append(record)
+        if len(self.buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            rows = [typed_record(record) for record in self.buffer]
+            columns = {name: [row[name] for row in rows] for name in self.schema.names}
+            self.writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+class ProjectStore(RecordSink):
+    """Queryable local store (SQLite, or DuckDB for a .duckdb path) upserting projects by RERA number.
+
+    SQLite gets indexes on promoter name and GST number; DuckDB cannot update
+    indexed columns in an upsert, so there only the registration number is
+    constrained and its column statistics serve the lookups.
+    """
+
+    def __init__(self, path, batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.buffer = []
+        if path.endswith('.duckdb'):
+            if duckdb is None:
+                raise ImportError("duckdb is required for a .duckdb store: pip install duckdb")
+            self.connection = duckdb.connect(path)
+            indexes = []
+        else:
+            # Portals crawled together upsert into one store from separate connections
+            self.connection = sqlite3.connect(path, timeout=60)
+            indexes = ["CREATE INDEX IF NOT EXISTS projects_promoter ON projects (promoter_name)",
+                       "CREATE INDEX IF NOT EXISTS projects_gst ON projects (gst_number)"]
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS projects (
+                rera_number TEXT PRIMARY KEY,
+                project_name TEXT,
+                promoter_name TEXT,
+                promoter_address TEXT,
+                gst_number TEXT,
+                registration_year INTEGER,
+                complete BOOLEAN,
+                filled INTEGER,
+                scraped_at TIMESTAMP
+            )""")
+        for statement in indexes:
+            self.connection.execute(statement)
+        self.connection.commit()
+
+    def write(self, record):
+        row = typed_record(record)
+        if row['rera_number'] is None:
+            # Nothing to key the upsert on
+            logger.debug("Skipping a record without a RERA number for the store")
+            return
+        row['filled'] = sum(1 for column in STORE_COLUMNS.values() if row[column] is not None)
+        self.buffer.append(row)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Upsert buffered rows; an existing project is only replaced by a record with as many fields filled"""
+        if not self.buffer:
+            return
+        columns = ['rera_number'] + [column for column in STORE_COLUMNS.values() if column != 'rera_number'] + \
+                  ['registration_year', 'complete', 'filled', 'scraped_at']
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns[1:])
+        # One row per key, so one statement never upserts the same key twice; the most
+        # complete wins, and among equals the latest
+        rows = {}
+        for row in self.buffer:
+            kept = rows.get(row['rera_number'])
+            if kept is None or row['filled'] >= kept['filled']:
+                rows[row['rera_number']] = row
+        self.connection.executemany(
+            f"INSERT INTO projects ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT (rera_number) DO UPDATE SET {updates} "
+            f"WHERE excluded.filled >= projects.filled",
+            [[row[column].isoformat(sep=' ') if column == 'scraped_at' else row[column] for column in columns]
+             for row in rows.values()])
+        self.connection.commit()
+        self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+
+class AsyncCrawlPipeline:
+    """listing fetch -> detail fetch -> extract -> sink, connected by bounded queues.
+
+    Detail fetches run up to max_in_flight at a time under the scraper's per-host
+    rate limiter; full queues make upstream stages wait (backpressure).
+    """
+
+    def __init__(self, scraper, max_in_flight=DEFAULT_MAX_IN_FLIGHT, queue_size=None):
+        self.scraper = scraper
+        self.max_in_flight = max_in_flight
+        self.queue_size = queue_size or max_in_flight * 2
+        self.projects = []
+        self.results = {}
+        self.started = {}
+        self.attempts = {}
+        self.deferred = 0
+        # Backoff tasks, referenced so the event loop cannot garbage-collect them mid-sleep
+        self.retry_tasks = set()
+
+    async def list_projects(self, details):
+        """Stage 1: walk the listing lazily and queue each project for fetching"""
+        listing = self.scraper.iter_listing_http()
+        while True:
+            project = await asyncio.to_thread(next, listing, None)
+            if project is None:
+                break
+            position = len(self.projects)
+            self.projects.append(project)
+            known = self.scraper.known_record(project)
+            if known is not None:
+                self.results[position] = self.scraper.finish_record(project, known, journal=False)
+                continue
+            await details.put((position, project))
+
+    async def fetch_details(self, details, pages):
+        """Stage 2: fetch detail pages within the per-host budget"""
+        while True:
+            item = await details.get()
+            if item is None:
+                break
+            try:
+                await self.fetch_one(item, details, pages)
+            finally:
+                # Always, or details.join() in run() would wait forever
+                details.task_done()
+
+    async def fetch_one(self, item, details, pages):
+        """Fetch one project's pages, then hand them on or schedule a retry"""
+        position, project = item
+        self.started.setdefault(position, time.perf_counter())
+        attempt = self.attempts[position] = self.attempts.get(position, 0) + 1
+        concurrency = self.scraper.concurrency
+        while not concurrency.try_acquire():
+            await asyncio.sleep(0.05)
+        try:
+            if project['url'] and not self.scraper.http.cached(project['url']):
+                await asyncio.sleep(self.scraper.rate_limiter.reserve(project['url']))
+            logger.info(f"🌐 Fetching project {position + 1} over HTTP")
+            main_html, promoter_html, failure = await asyncio.to_thread(self.scraper.fetch_detail_pages, project)
+        except Exception as e:
+            logger.error(f"❌ Error fetching project {position + 1}: {str(e)}")
+            main_html, promoter_html, failure = None, None, classify_failure(e)
+        finally:
+            concurrency.release()
+        concurrency.record(failure)
+
+        if failure and self.scraper.retry_policy.should_retry(failure, attempt):
+            # Back off on the side so other projects keep flowing
+            delay = self.scraper.retry_policy.delay(attempt)
+            self.scraper.metrics.increment('retries', kind=failure)
+            logger.info(f"🔁 Retrying project {position + 1} ({failure}) in {delay:.1f}s")
+            self.deferred += 1
+            task = asyncio.create_task(self.retry_later(details, item, delay))
+            self.retry_tasks.add(task)
+            task.add_done_callback(self.retry_tasks.discard)
+        else:
+            if failure:
+                self.scraper.metrics.increment('failed_projects', kind=failure)
+            await pages.put((position, (main_html, promoter_html)))
+
+    async def retry_later(self, details, item, delay):
+        await asyncio.sleep(delay)
+        await details.put(item)
+        self.deferred -= 1
+
+    async def extract_pages(self, pages, records):
+        """Stage 3: run the lxml extractor off the event loop"""
+        while True:
+            item = await pages.get()
+            if item is None:
+                break
+            position, (html, promoter_html) = item
+            try:
+                with self.scraper.metrics.timer('http_extract'):
+                    record = await asyncio.to_thread(self.scraper.extractor.extract, html, promoter_html) if html else None
+            except Exception as e:
+                logger.error(f"❌ Error extracting project {position + 1}: {str(e)}")
+                record = None
+            await records.put((position, record or {key: 'Error' for key in FIELDS}))
+
+    async def sink_records(self, records):
+        """Stage 4: collect records by listing position"""
+        while True:
+            item = await records.get()
+            if item is None:
+                break
+            position, record = item
+            self.scraper.metrics.observe('project', time.perf_counter() - self.started.pop(position))
+            # In auto mode incomplete records are held back for the browser and finished there
+            if self.scraper.fetch_mode == 'http' or self.scraper.replay or not has_missing_fields(record):
+                try:
+                    # Journal fsyncs and sink/store writes block; keep them off the loop driving the fetches
+                    record = await asyncio.to_thread(self.scraper.finish_record, self.projects[position], record)
+                except Exception as e:
+                    # Keep draining, otherwise the upstream stages block on full queues
+                    logger.error(f"❌ Error writing project {position + 1}: {str(e)}")
+            self.results[position] = record
+
+    async def run(self):
+        """Run all stages to completion; returns (projects, records) in listing order"""
+        details = asyncio.Queue(maxsize=self.queue_size)
+        pages = asyncio.Queue(maxsize=self.queue_size)
+        records = asyncio.Queue(maxsize=self.queue_size)
+
+        fetchers = [asyncio.create_task(self.fetch_details(details, pages)) for _ in range(self.max_in_flight)]
+        extractor = asyncio.create_task(self.extract_pages(pages, records))
+        sink = asyncio.create_task(self.sink_records(records))
+
+        try:
+            await self.list_projects(details)
+            # Wait for queued fetches and any retries still backing off
+            while True:
+                await details.join()
+                if not self.deferred:
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            for _ in fetchers:
+                await details.put(None)
+            await asyncio.gather(*fetchers)
+            await pages.put(None)
+            await extractor
+            await records.put(None)
+            await sink
+
+        return self.projects, [self.results[i] for i in range(len(self.projects))]
+
+
+def listing_signature(row_text):
+    """RERA number and a change fingerprint for a project's listing row"""
+    text = ' '.join((row_text or '').split())
+    match = RERA_NUMBER_PATTERN.search(text)
+    return (match.group(0) if match else None), hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class CrawlState:
+    """Listing fingerprints and records from previous runs, keyed by RERA number, for incremental crawls"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Ignoring unreadable crawl state {path}: {str(e)}")
+
+    @staticmethod
+    def key(project):
+        return project.get('rera') or project['id']
+
+    def unchanged_record(self, project):
+        """The stored record if this listing row is identical to last time, else None"""
+        entry = self.entries.get(self.key(project))
+        if entry and project.get('fingerprint') and entry['fingerprint'] == project['fingerprint']:
+            return entry['record']
+        return None
+
+    def remember(self, project, record):
+        """Store a finished project's listing row and record; entries outside this run's listing are kept"""
+        if not project.get('fingerprint') or all(value == 'Error' for value in record.values()):
+            return
+        self.entries[self.key(project)] = {'id': project['id'], 'fingerprint': project['fingerprint'],
+                                           'updated_at': datetime.now().isoformat(), 'record': record}
+
+    def save(self):
+        """Write the state atomically so an interrupted save never corrupts the previous one"""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+
+class WorkQueue:
+    """Shared SQLite queue of harvested projects for coordinator/worker crawls.
+
+    Workers on any machine that can reach the database file claim one project at
+    a time under a lease; a lease that expires (worker died) makes the project
+    claimable again. Results are collected in the same database, deduplicated on
+    RERA registration number, keeping the most complete record.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS items (
+        position INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id TEXT UNIQUE NOT NULL,
+        project TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        lease_owner TEXT,
+        lease_expires REAL,
+        attempts INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS items_status ON items (status, lease_expires);
+    CREATE TABLE IF NOT EXISTS results (
+        rera TEXT PRIMARY KEY,
+        position INTEGER NOT NULL,
+        project_id TEXT NOT NULL,
+        record TEXT NOT NULL,
+        missing INTEGER NOT NULL,
+        worker TEXT,
+        finished_at TEXT
+    );
+    """
+
+    def __init__(self, path, lease_seconds=DEFAULT_LEASE_SECONDS, max_attempts=DEFAULT_MAX_ATTEMPTS_PER_PROJECT):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None, check_same_thread=False)
+        with self.lock:
+            self.connection.executescript(self.SCHEMA)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Serialise writers across processes with an immediate write lock"""
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def push(self, project, record=None):
+        """Queue a project once (by id); a known record is stored as already done. Returns True if new"""
+        with self.transaction() as db:
+            cursor = db.execute("INSERT OR IGNORE INTO items (project_id, project, status) VALUES (?, ?, ?)",
+                                (project['id'], json.dumps(project), 'pending' if record is None else 'done'))
+            added = cursor.rowcount == 1
+            if added and record is not None:
+                self.store_result(db, cursor.lastrowid, project, record, None)
+        return added
+
+    def claim(self, worker_id):
+        """Lease the next pending (or expired) project; returns (position, project) or None"""
+        now = time.time()
+        with self.transaction() as db:
+            # A project whose worker keeps dying never reaches fail(), so spent leases fail here
+            db.execute("UPDATE items SET status = 'failed', lease_owner = NULL, lease_expires = NULL "
+                       "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?", (now, self.max_attempts))
+            row = db.execute("SELECT position, project FROM items WHERE status = 'pending' "
+                             "OR (status = 'leased' AND lease_expires < ?) ORDER BY position LIMIT 1",
+                             (now,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE items SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                       "attempts = attempts + 1 WHERE position = ?", (worker_id, now + self.lease_seconds, row[0]))
+        return row[0], json.loads(row[1])
+
+    @staticmethod
+    def store_result(db, position, project, record, worker_id):
+        """Upsert a record under its RERA number, replacing an existing one only if it is more complete"""
+        rera = record.get('Rera Regd. No')
+        if not rera or rera in ('Not Available', 'Error'):
+            rera = project.get('rera') or project['id']
+        missing = sum(1 for field in FIELDS if record.get(field) in ('Not Available', 'Error'))
+        db.execute("INSERT INTO results (rera, position, project_id, record, missing, worker, finished_at) "
+                   "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (rera) DO UPDATE SET "
+                   "position = excluded.position, project_id = excluded.project_id, record = excluded.record, "
+                   "missing = excluded.missing, worker = excluded.worker, finished_at = excluded.finished_at "
+                   "WHERE excluded.missing < results.missing",
+                   (rera, position, project['id'], json.dumps(record, ensure_ascii=False), missing, worker_id,
+                    datetime.now().isoformat(timespec='seconds')))
+
+    def complete(self, position, project, record, worker_id):
+        """Store a finished project's record and release its lease"""
+        with self.transaction() as db:
+            db.execute("UPDATE items SET status = 'done', lease_owner = NULL, lease_expires = NULL "
+                       "WHERE position = ?", (position,))
+            self.store_result(db, position, project, record, worker_id)
+
+    def fail(self, position):
+        """Return a project to the queue, or mark it failed once it has used up its attempts"""
+        with self.transaction() as db:
+            db.execute("UPDATE items SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                       "lease_owner = NULL, lease_expires = NULL WHERE position = ?", (self.max_attempts, position))
+
+    def counts(self):
+        """Number of projects per status"""
+        with self.lock:
+            return dict(self.connection.execute("SELECT status, COUNT(*) FROM items GROUP BY status").fetchall())
+
+    def outstanding(self):
+        """Projects not yet done or failed, including ones leased by other workers"""
+        counts = self.counts()
+        return counts.get('pending', 0) + counts.get('leased', 0)
+
+    def records(self):
+        """Collected records in listing order"""
+        with self.lock:
+            rows = self.connection.execute("SELECT record FROM results ORDER BY position").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self):
+        self.connection.close()
+
+
+def has_missing_fields(record):
+    """True if any field of an extracted record is a placeholder"""
+    return any(record.get(field) in ('Not Available', 'Error') for field in FIELDS)
+
+
+class ResourceBlocker:
+    """Drops resource types and URL patterns not needed for extraction, and reports what each page loaded"""
+
+    def __init__(self, resource_types=None, url_patterns=None):
+        self.resource_types = DEFAULT_BLOCKED_RESOURCE_TYPES if resource_types is None else resource_types
+        self.url_patterns = DEFAULT_BLOCKED_URL_PATTERNS if url_patterns is None else url_patterns
+
+    def blocked_urls(self):
+        patterns = list(self.url_patterns)
+        for resource_type in self.resource_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+        return patterns
+
+    def configure_options(self, chrome_options):
+        """Browser-level switches; these apply before the first request of every page"""
+        if 'image' in self.resource_types:
+            # --disable-images is not a Chrome switch; blink settings and content settings are honoured
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2})
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    def install(self, driver):
+        """Turn on DevTools network blocking for a new session"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls()})
+
+    @staticmethod
+    def page_report(driver):
+        """Requests made, bytes transferred and requests blocked since the previous report"""
+        report = {'requests': 0, 'bytes': 0, 'blocked': 0, 'blocked_by_type': {}}
+        request_types = {}
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException:
+            return report
+
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            params = message.get('params', {})
+            if message['method'] == 'Network.requestWillBeSent':
+                report['requests'] += 1
+                request_types[params.get('requestId')] = params.get('type', 'Other')
+            elif message['method'] == 'Network.loadingFinished':
+                report['bytes'] += int(params.get('encodedDataLength', 0))
+            elif message['method'] == 'Network.loadingFailed' and params.get('blockedReason'):
+                resource_type = params.get('type') or request_types.get(params.get('requestId'), 'Other')
+                report['blocked'] += 1
+                report['blocked_by_type'][resource_type] = report['blocked_by_type'].get(resource_type, 0) + 1
+        return report
+
+
+def create_chrome_driver(chromedriver_path, resource_blocker=None, lean=False):
+    """Start Chrome WebDriver with enhanced options; lean sessions are headless and memory-capped"""
+    chrome_options = Options()
+    if lean:
+        for argument in LEAN_CHROME_ARGUMENTS:
+            chrome_options.add_argument(argument)
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-plugins")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    if resource_blocker:
+        resource_blocker.configure_options(chrome_options)
+
+    service = Service(chromedriver_path)
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if resource_blocker:
+        resource_blocker.install(driver)
+
+    logger.info(f"✅ Chrome WebDriver initialized successfully{' (lean headless)' if lean else ''}")
+    return driver
+
+
+def process_memory_kb(pid):
+    """Proportional set size of one process in kB (shared pages split between their users), else its RSS"""
+    for path, prefix in ((f"/proc/{pid}/smaps_rollup", "Pss:"), (f"/proc/{pid}/status", "VmRSS:")):
+        try:
+            with open(path) as f:
+                for line in f:
+                    if line.startswith(prefix):
+                        return int(line.split()[1])
+        except (OSError, ValueError):
+            continue
+    return 0
+
+
+def process_tree_pss_mb(pid):
+    """Memory of a process and all of its descendants in MB, read from /proc (Linux only).
+
+    PSS rather than RSS, so pages Chrome's processes share are counted once overall.
+    """
+    total_kb = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total_kb += process_memory_kb(current)
+        try:
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024
+
+
+def driver_memory_mb(driver):
+    """Memory used by a session's chromedriver and browser processes, or None where it cannot be measured"""
+    try:
+        pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    return process_tree_pss_mb(pid) if os.path.isdir("/proc") else None
+
+
+def is_healthy(driver):
+    """True if the session still answers commands"""
+    try:
+        return driver.execute_script("return 1") == 1
+    except Exception:
+        return False
+
+
+def create_driver_pool(chromedriver_path, resource_blocker=None, lean=False, max_pages=DEFAULT_SESSION_MAX_PAGES,
+                       max_memory_mb=None):
+    """Chrome session pool, optionally of lean sessions; pool sizing follows their measured memory"""
+    factory = functools.partial(create_chrome_driver, chromedriver_path, resource_blocker, lean)
+    return DriverPool(factory, max_pages=max_pages, max_memory_mb=max_memory_mb)
+
+
+class DriverPool:
+    """Warm Chrome sessions shared across jobs and workers.
+
+    Sessions are health-checked when handed out, recycled after max_pages
+    pages, once their memory (PSS) has grown by max_rss_growth_mb or passed
+    max_memory_mb, and replaced transparently when they crash. The largest
+    memory measured on a loaded page sizes the worker pool; until a session
+    has been measured the DRIVER_MEMORY_MB estimate is used.
+    """
+
+    def __init__(self, factory, max_pages=DEFAULT_SESSION_MAX_PAGES,
+                 max_rss_growth_mb=DEFAULT_SESSION_MAX_RSS_GROWTH_MB, max_memory_mb=None):
+        self.factory = factory
+        self.max_pages = max_pages
+        self.max_rss_growth_mb = max_rss_growth_mb
+        self.max_memory_mb = max_memory_mb
+        self.measured_mb = None
+        self.idle = []
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def start(self):
+        driver = self.factory()
+        with self.lock:
+            self.sessions[id(driver)] = {'pages': 0, 'baseline_mb': driver_memory_mb(driver)}
+        return driver
+
+    @property
+    def session_memory_mb(self):
+        """Memory to budget per session when sizing the worker pool"""
+        if self.measured_mb is None:
+            return DRIVER_MEMORY_MB
+        return max(1, int(self.measured_mb * SESSION_MEMORY_HEADROOM))
+
+    def measure(self, driver):
+        """A session's current memory, remembered as the largest seen with a page loaded"""
+        memory = driver_memory_mb(driver)
+        if memory:
+            with self.lock:
+                self.measured_mb = max(self.measured_mb or 0, memory)
+        return memory
+
+    def acquire(self):
+        """A healthy session: a warm idle one if available, otherwise a new one"""
+        while True:
+            with self.lock:
+                driver = self.idle.pop() if self.idle else None
+            if driver is None:
+                return self.start()
+            if is_healthy(driver):
+                logger.info("♻️ Reusing warm Chrome session")
+                return driver
+            logger.warning("⚠️ Discarding unresponsive idle Chrome session")
+            self.discard(driver)
+
+    def record_page(self, driver):
+        with self.lock:
+            if id(driver) in self.sessions:
+                self.sessions[id(driver)]['pages'] += 1
+
+    def needs_recycle(self, driver):
+        """True once a session has served too many pages or grown too large"""
+        session = self.sessions.get(id(driver))
+        if not session:
+            return False
+        if self.max_pages and session['pages'] >= self.max_pages:
+            logger.info(f"🔁 Recycling Chrome session after {session['pages']} pages")
+            return True
+        memory = self.measure(driver)
+        baseline = session['baseline_mb']
+        if self.max_rss_growth_mb and memory is not None and baseline is not None \
+                and memory - baseline > self.max_rss_growth_mb:
+            logger.info(f"🔁 Recycling Chrome session after memory grew to {memory:.0f}MB")
+            return True
+        if self.max_memory_mb and memory is not None and memory > self.max_memory_mb:
+            logger.info(f"🔁 Recycling Chrome session at {memory:.0f}MB (limit {self.max_memory_mb}MB)")
+            return True
+        return False
+
+    def replace(self, driver):
+        """Throw a session away and start a fresh one in its place"""
+        self.discard(driver)
+        return self.start()
+
+    def release(self, driver):
+        """Return a session for reuse, or retire it if it is unhealthy or due for recycling"""
+        if not is_healthy(driver) or self.needs_recycle(driver):
+            self.discard(driver)
+            return
+        try:
+            # Leave the session in a neutral state for the next job
+            for handle in driver.window_handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            driver.get("about:blank")
+        except WebDriverException:
+            self.discard(driver)
+            return
+        with self.lock:
+            self.idle.append(driver)
+
+    def discard(self, driver):
+        with self.lock:
+            self.sessions.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle session"""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for driver in idle:
+            self.discard(driver)
+
+
+def listing_page_url(href, page, target_page):
+    """Rewrite a link to listing page `page` so it points at `target_page`, if the page number is in its query"""
+    parts = urlparse(href)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if sum(1 for _, value in query if value == str(page)) != 1:
+        return None
+    query = [(key, str(target_page) if value == str(page) else value) for key, value in query]
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+def is_navigable_href(href):
+    """True if an href points at a real page rather than a script hook or anchor"""
+    return bool(href) and not href.startswith('javascript:') and not href.endswith('#')
+
+
+def available_memory_mb():
+    """Memory available to new processes in MB: MemAvailable, which counts reclaimable page cache, where present"""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError):
+        pass
+    # Free pages only; an underestimate on hosts with a warm page cache
+    return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') // (1024 * 1024)
+
+
+def max_worker_count(requested, session_memory_mb=DRIVER_MEMORY_MB):
+    """Bound the requested number of browser workers by CPU count and available memory"""
+    limit = os.cpu_count() or 1
+    try:
+        limit = min(limit, max(1, available_memory_mb() // session_memory_mb))
+    except (ValueError, OSError, AttributeError):
+        pass
+    return max(1, min(requested, limit))
+
+
+def is_valid_value(text):
+    """True if extracted text is a real value rather than an empty placeholder"""
+    return bool(text) and text.lower() not in PLACEHOLDER_VALUES
+
+
+def is_valid_project_name(text):
+    """Filter out numbers, generic terms, and short strings picked up as project names"""
+    return (is_valid_value(text) and
+            not text.isdigit() and  # Not a pure number
+            text.lower() not in ['projects', 'project', 'rera', 'registration'] and
+            len(text) > 2 and
+            not text.startswith('http'))
+
+
+def clean_project_data(project_data):
+    """Remove extra commas and whitespace left over from the site's address formatting"""
+    for key, value in project_data.items():
+        if isinstance(value, str):
+            cleaned_value = re.sub(REPEATED_COMMAS, ',', value).strip(' ,')
+            project_data[key] = cleaned_value if cleaned_value else "Not Available"
+    return project_data
+
+
+def canonical_rera_number(text):
+    """RP/1/2025/1362-style numbers in the listing's canonical RP/01/2025/1362 form, or None"""
+    match = re.search(RERA_NUMBER_PARTS, (text or '').upper())
+    if not match:
+        return None
+    prefix, district, year, serial = match.groups()
+    return f"{prefix}/{district.zfill(2)}/{year}/{serial}"
+
+
+def gstin_checksum_valid(gstins):
+    """Vectorized GSTIN check: well-formed and the 15th character matches the mod-36 checksum"""
+    valid = gstins.str.match(GSTIN_PATTERN, na=False).to_numpy(copy=True)
+    if not valid.any():
+        return pd.Series(valid, index=gstins.index)
+    # One row of character values per well-formed GSTIN
+    codes = np.frombuffer(''.join(gstins[valid]).encode('ascii'), dtype=np.uint8).reshape(-1, 15)
+    values = np.where(codes <= ord('9'), codes - ord('0'), codes - ord('A') + 10).astype(np.int64)
+    products = values[:, :14] * np.tile([1, 2], 7)
+    total = (products // 36 + products % 36).sum(axis=1)
+    valid[valid] = (36 - total % 36) % 36 == values[:, 14]
+    return pd.Series(valid, index=gstins.index)
+
+
+def promoter_key(names):
+    """Vectorized matching key for promoter names: upper case, no M/S prefix, punctuation or legal-form variants"""
+    key = names.str.upper().str.replace(r'^M\s*/\s*S\.?\s*', '', regex=True)
+    for pattern, replacement in PROMOTER_SUFFIXES:
+        key = key.str.replace(pattern, replacement, regex=True)
+    return key.str.replace(r'[^A-Z0-9 ]', ' ', regex=True).str.split().str.join(' ')
+
+
+def normalize_records(df):
+    """Batch cleanup of a result set: canonical RERA numbers and GSTINs, tidy addresses, merged promoters.
+
+    Returns the normalized frame (one row per RERA number, the most complete one
+    kept) and a dict of what was changed and what failed validation.
+    """
+    # FIELDS first; other columns (e.g. Other Details) are carried through untouched
+    df = df.reindex(columns=FIELDS + [column for column in df.columns if column not in FIELDS])
+    df[FIELDS] = df[FIELDS].fillna('Not Available').astype(str)
+    available = ~df[FIELDS].isin(['Not Available', 'Error'])
+    stats = {'rows': len(df)}
+
+    # Whitespace and comma runs, in every field
+    for field in FIELDS:
+        cleaned = df[field].str.replace(REPEATED_COMMAS, ',', regex=True)
+        cleaned = cleaned.str.replace(r'\s+', ' ', regex=True).str.strip(' ,').where(available[field], df[field])
+        df[field] = cleaned.mask(cleaned == '', 'Not Available')
+    available = ~df[FIELDS].isin(['Not Available', 'Error'])
+
+    # RERA numbers: pieces extracted in one pass, district zero-padded
+    parts = df['Rera Regd. No'].str.upper().str.extract(RERA_NUMBER_PARTS)
+    canonical = parts[0] + '/' + parts[1].str.zfill(2) + '/' + parts[2] + '/' + parts[3]
+    stats['rera_canonicalized'] = int((canonical.notna() & (canonical != df['Rera Regd. No'])).sum())
+    stats['rera_invalid'] = int((canonical.isna() & available['Rera Regd. No']).sum())
+    df['Rera Regd. No'] = canonical.fillna(df['Rera Regd. No'])
+
+    # GSTINs: upper case without separators; invalid ones are kept but counted
+    gstins = df['GST No'].str.upper().str.replace(r'[\s\-./]', '', regex=True)
+    valid_gstins = gstin_checksum_valid(gstins)
+    stats['gstin_invalid'] = int((~valid_gstins & available['GST No']).sum())
+    df['GST No'] = gstins.where(valid_gstins, df['GST No'])
+
+    # Promoters: every spelling of the same company takes its most common spelling
+    names = df['Promoter Name'].str.replace(r'^M\s*/\s*S\.?\s*', 'M/S. ', case=False, regex=True)
+    keys = promoter_key(names).where(available['Promoter Name'])
+    counts = pd.DataFrame({'key': keys, 'name': names}).dropna().value_counts().reset_index()
+    spelling = counts.drop_duplicates('key').set_index('key')['name']
+    merged = keys.map(spelling).fillna(names)
+    stats['promoters_merged'] = int((merged != df['Promoter Name']).sum())
+    stats['promoters'] = int(keys.nunique())
+    df['Promoter Name'] = merged
+
+    # Duplicate projects: keep the most complete row per RERA number
+    df['_complete'] = available.sum(axis=1)
+    duplicated = df.sort_values('_complete', ascending=False, kind='stable').duplicated('Rera Regd. No')
+    duplicated &= available['Rera Regd. No']
+    stats['duplicates_removed'] = int(duplicated.sum())
+    df = df[~duplicated.reindex(df.index)].drop(columns='_complete').reset_index(drop=True)
+    return df, stats
+
+
+def coverage_report(df):
+    """Per-field count and percentage of real values, computed column-wise"""
+    available = ~df.reindex(columns=FIELDS).isin(['Not Available', 'Error']) & df.reindex(columns=FIELDS).notna()
+    report = pd.DataFrame({'available': available.sum(), 'total': len(df)})
+    report['percentage'] = (report['available'] / max(len(df), 1) * 100).round(1)
+    return report
+
+
+# Portal crawled when no --site is given; its state files keep their plain names
+DEFAULT_SITE = 'odisha'
+
+
+class SiteProfile:
+    """Everything portal-specific: URLs, listing and pagination, detail navigation and field selectors.
+
+    The defaults are the generic table layout most portals share; a portal's profile is
+    a subclass overriding attributes (see OdishaProfile), or a JSON/YAML file with the
+    same keys (see from_dict). Outputs, journal, state and selector stats of non-default
+    profiles are kept apart by suffixing their file names with the profile name.
+    """
+
+    # Keys a profile may set, besides `fields`
+    SETTINGS = {'name', 'base_url', 'output_prefix', 'view_details_selectors', 'listing_row_xpath',
+                'next_page_selectors', 'promoter_tab_selectors', 'promoter_pane_xpath', 'detail_ready_xpath',
+                'promoter_fields', 'field_labels', 'project_name_keywords'}
+
+    name = None
+    base_url = None
+    output_prefix = None
+    view_details_selectors = VIEW_DETAILS_SELECTORS
+    listing_row_xpath = LISTING_ROW_XPATH
+    next_page_selectors = NEXT_PAGE_SELECTORS
+    promoter_tab_selectors = PROMOTER_TAB_SELECTORS
+    promoter_pane_xpath = PROMOTER_PANE_XPATH
+    detail_ready_xpath = DETAIL_READY_XPATH
+    promoter_fields = PROMOTER_FIELDS
+    field_labels = FIELD_LABELS
+    project_name_keywords = PROJECT_NAME_KEYWORDS
+
+    def __init__(self, **overrides):
+        fields = overrides.pop('fields', {})
+        for key, value in overrides.items():
+            if key not in self.SETTINGS:
+                raise ValueError(f"Unknown site profile setting: {key}")
+            setattr(self, key, value)
+        if not self.output_prefix:
+            self.output_prefix = f"{self.name}_rera_projects"
+
+        # Generic selectors, with the keyword selector slotted in after the headings
+        self.field_selectors = dict(FIELD_SELECTORS)
+        if self.project_name_keywords:
+            self.field_selectors['Project Name'] = NAME_SELECTORS[:6] + \
+                [name_keyword_selector(self.project_name_keywords)] + NAME_SELECTORS[6:]
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields in site profile {self.name}: {', '.join(sorted(unknown))}")
+        self.field_selectors.update(fields)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Profile from parsed JSON/YAML: any of SETTINGS as a key, plus `fields` mapping field -> selectors"""
+        # The name keys every per-portal file, so a nameless profile would share the default portal's
+        if not isinstance(data, dict) or not data.get('name'):
+            raise ValueError("Site profiles must set a name")
+        if not data.get('base_url'):
+            raise ValueError(f"Site profile {data['name']} must set a base_url")
+        return cls(**data)
+
+    @classmethod
+    def load(cls, path):
+        """Load a declarative profile from a .json, .yaml or .yml file"""
+        with open(path, encoding='utf-8') as f:
+            if path.endswith(('.yaml', '.yml')):
+                if yaml is None:
+                    raise ImportError("PyYAML is required for YAML site profiles: pip install pyyaml")
+                data = yaml.safe_load(f)
+            else:
+                data = json.load(f)
+        return cls.from_dict(data)
+
+    def selectors(self):
+        """Every lxml-evaluated selector of the profile, for compiling up front"""
+        selectors = list(self.view_details_selectors) + list(self.next_page_selectors) + \
+            [self.promoter_pane_xpath, self.detail_ready_xpath]
+        for field_selectors in self.field_selectors.values():
+            selectors.extend(field_selectors)
+        return selectors
+
+    def path_for(self, path):
+        """Per-portal variant of a state file path; the default portal keeps the plain name"""
+        if not path or self.name == DEFAULT_SITE:
+            return path
+        root, extension = os.path.splitext(path)
+        return f"{root}.{self.name}{extension}"
+
+
+class OdishaProfile(SiteProfile):
+    """Odisha RERA portal: the generic layout plus project names the keyword list misses"""
+
+    name = 'odisha'
+    base_url = "https://rera.odisha.gov.in/projects/project-list"
+    output_prefix = "odisha_rera_projects_fixed"
+    project_name_keywords = PROJECT_NAME_KEYWORDS + ODISHA_PROJECT_NAMES
+
+
+# Built-in portals by name; --site also accepts a profile file
+SITE_PROFILES = {
+    'odisha': OdishaProfile,
+}
+
+
+def load_site_profile(site):
+    """A built-in profile by name, or one loaded from a JSON/YAML file"""
+    if site in SITE_PROFILES:
+        return SITE_PROFILES[site]()
+    return SiteProfile.load(site)
+
+
+class SelectorRegistry:
+    """Compiled selector strategies with per-field hit/miss and latency stats.
+
+    Strategies are tried in order of their smoothed recent hit rate, so the
+    selector that currently wins for a field is attempted first and one that
+    stopped matching after a redesign sinks within a few dozen attempts.
+    Stats can be persisted to a JSON file and reloaded on the next run.
+    """
+
+    def __init__(self, stats_path=None, metrics=None):
+        self.stats_path = stats_path
+        self.metrics = metrics
+        self.stats = {}
+        self.locators = {}
+        self.lock = threading.Lock()
+        if stats_path and os.path.exists(stats_path):
+            try:
+                with open(stats_path, encoding='utf-8') as f:
+                    self.stats = json.load(f)
+                logger.info(f"📚 Loaded selector stats for {len(self.stats)} fields from {stats_path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Ignoring unreadable selector stats {stats_path}: {str(e)}")
+
+    def locator(self, selector):
+        """Selenium (By, value) pair for a selector, computed once"""
+        if selector not in self.locators:
+            self.locators[selector] = (By.XPATH if selector.startswith("//") else By.CSS_SELECTOR, selector)
+        return self.locators[selector]
+
+    @staticmethod
+    def recent(entry):
+        """Decayed (hits, misses); stats saved before decay was tracked are scaled down to the same window"""
+        if 'recent_hits' not in entry:
+            scale = min(1.0, 1 / (1 - SELECTOR_STATS_DECAY) / max(1, entry['hits'] + entry['misses']))
+            entry['recent_hits'] = entry['hits'] * scale
+            entry['recent_misses'] = entry['misses'] * scale
+        return entry['recent_hits'], entry['recent_misses']
+
+    def hit_rate(self, field, selector):
+        """Laplace-smoothed recent hit rate; an untried selector scores 0.5"""
+        entry = self.stats.get(field, {}).get(selector)
+        if not entry:
+            return 0.5
+        hits, misses = self.recent(entry)
+        return (hits + 1) / (hits + misses + 2)
+
+    def ordered(self, field, selectors):
+        """Selectors for a field, best recent hit rate first (ties keep the declared order)"""
+        with self.lock:
+            ranked = sorted(enumerate(selectors), key=lambda item: (-self.hit_rate(field, item[1]), item[0]))
+        return [selector for _, selector in ranked]
+
+    def record(self, field, selector, hit, seconds):
+        """Count one attempt of a selector for a field"""
+        with self.lock:
+            entry = self.stats.setdefault(field, {}).setdefault(selector, {'hits': 0, 'misses': 0, 'seconds': 0.0})
+            hits, misses = self.recent(entry)
+            entry['recent_hits'] = hits * SELECTOR_STATS_DECAY + hit
+            entry['recent_misses'] = misses * SELECTOR_STATS_DECAY + (not hit)
+            entry['hits' if hit else 'misses'] += 1
+            entry['seconds'] += seconds
+        if self.metrics:
+            self.metrics.observe('selector', seconds, field=field, outcome='hit' if hit else 'miss')
+
+    def save(self):
+        """Persist stats so the next run starts with the learned order"""
+        if not self.stats_path:
+            return
+        try:
+            with self.lock, open(self.stats_path, 'w', encoding='utf-8') as f:
+                json.dump(self.stats, f, indent=2)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save selector stats: {str(e)}")
+
+    def log_summary(self):
+        """Log the winning selector per field with its hit rate and average latency"""
+        for field, field_stats in sorted(self.stats.items()):
+            attempts = sum(entry['hits'] + entry['misses'] for entry in field_stats.values())
+            selector, entry = max(field_stats.items(), key=lambda item: self.hit_rate(field, item[0]))
+            tries = entry['hits'] + entry['misses']
+            logger.info(f"🎯 {field}: {entry['hits']}/{tries} hits, "
+                        f"{entry['seconds'] / tries * 1000:.1f}ms avg, "
+                        f"{attempts} attempts total - {selector}")
+
+
+class HtmlProjectExtractor:
+    """Evaluate the field selectors against saved page HTML with lxml instead of live WebDriver lookups"""
+
+    _compiled = {}
+
+    def __init__(self, selector_registry=None, metrics=None, profile=None):
+        self.selectors = selector_registry or SelectorRegistry()
+        self.metrics = metrics or CrawlMetrics()
+        self.profile = profile or OdishaProfile()
+        # Compile the whole profile once so a broken selector fails at startup rather than mid-crawl
+        for selector in self.profile.selectors():
+            self.compile_selector(selector)
+
+    @classmethod
+    def compile_selector(cls, selector):
+        """Compile an XPath or CSS selector once and cache it for every later page"""
+        if selector not in cls._compiled:
+            if selector.startswith("//"):
+                cls._compiled[selector] = etree.XPath(selector)
+            else:
+                cls._compiled[selector] = CSSSelector(selector)
+        return cls._compiled[selector]
+
+    @staticmethod
+    def is_hidden(element):
+        """Approximate Selenium's visibility rules: inactive tab panes and display:none ancestors"""
+        node = element
+        while node is not None:
+            classes = (node.get('class') or '').split()
+            style = (node.get('style') or '').replace(' ', '').lower()
+            if 'tab-pane' in classes and 'active' not in classes and 'show' not in classes:
+                return True
+            if 'display:none' in style or node.get('hidden') is not None:
+                return True
+            node = node.getparent()
+        return False
+
+    @staticmethod
+    def element_text(element):
+        """Visible text of an element with whitespace collapsed"""
+        return ' '.join(element.text_content().split())
+
+    def select_text(self, tree, selectors, field_name, validator=is_valid_value):
+        """Return the first valid text matched by the selectors, in order"""
+        for attempt, selector in enumerate(self.selectors.ordered(field_name, selectors)):
+            start = time.perf_counter()
+            try:
+                elements = self.compile_selector(selector)(tree)
+            except (etree.XPathError, ValueError) as e:
+                logger.debug(f"Selector failed for {field_name}: {selector} - {str(e)}")
+                self.selectors.record(field_name, selector, False, time.perf_counter() - start)
+                continue
+
+            for element in elements:
+                if not isinstance(element, etree.ElementBase) or self.is_hidden(element):
+                    continue
+                text = self.element_text(element)
+                if validator(text):
+                    self.selectors.record(field_name, selector, True, time.perf_counter() - start)
+                    if attempt:
+                        self.metrics.increment('selector_fallbacks', field=field_name)
+                    logger.info(f"✅ Found {field_name}: {text}")
+                    return text
+
+            self.selectors.record(field_name, selector, False, time.perf_counter() - start)
+
+        self.metrics.increment('fields_not_found', field=field_name)
+        return "Not Available"
+
+    def promoter_pane(self, tree):
+        """Detach the pre-rendered promoter pane so it can be searched as if its tab were active"""
+        panes = self.compile_selector(self.profile.promoter_pane_xpath)(tree)
+        if not panes:
+            return tree
+        pane = copy.deepcopy(panes[0])
+        pane.set('class', (pane.get('class') or '') + ' active')
+        return pane
+
+    def from_label_map(self, sections, promoter_sections):
+        """Map label/value pairs from LABEL_VALUE_JS onto FIELDS; returns (record, unmapped pairs)"""
+        other_sections = [name for name in sections if name not in promoter_sections]
+        used = set()
+        project_data = {}
+        for field in FIELDS:
+            names = promoter_sections if field in self.profile.promoter_fields else other_sections
+            validator = is_valid_project_name if field == 'Project Name' else is_valid_value
+            project_data[field] = "Not Available"
+            # Exact label matches beat partial ones, e.g. "GST No" before a longer label containing "GST"
+            candidates = [(alias.lower() != label.lower(), number, name, label)
+                          for number, alias in enumerate(self.profile.field_labels[field])
+                          for name in names for label in sections[name]
+                          if alias.lower() in label.lower()]
+            for _, _, name, label in sorted(candidates):
+                if (name, label) not in used and validator(sections[name][label]):
+                    used.add((name, label))
+                    project_data[field] = sections[name][label]
+                    logger.info(f"✅ Found {field}: {project_data[field]}")
+                    break
+
+        extras = {label: value for name, values in sections.items() for label, value in values.items()
+                  if (name, label) not in used}
+        return clean_project_data(project_data), extras
+
+    def has_promoter_pane(self, tree):
+        """True if the promoter pane is pre-rendered with its labels, so its tab need not be clicked"""
+        panes = self.compile_selector(self.profile.promoter_pane_xpath)(tree)
+        if not panes:
+            return False
+        text = panes[0].text_content().lower()
+        return any(label.lower() in text for field in self.profile.promoter_fields
+                   for label in self.profile.field_labels[field])
+
+    def pane_snapshot(self, html):
+        """Serialized promoter pane of a page (the whole page if it has none), for archiving"""
+        tree = lxml_html.fromstring(html)
+        pane = self.promoter_pane(tree)
+        return html if pane is tree else etree.tostring(pane, encoding='unicode', method='html')
+
+    def extract(self, main_html, promoter_html=None):
+        """Extract a project record from the overview page and (optionally) the promoter tab snapshot"""
+        return self.extract_tree(lxml_html.fromstring(main_html),
+                                 lxml_html.fromstring(promoter_html) if promoter_html else None)
+
+    def extract_tree(self, main_tree, promoter_tree=None):
+        """Extract a project record from already parsed pages"""
+        if promoter_tree is None:
+            # Saved pages, skipped and failed tab clicks: fall back to the hidden pane in the same document
+            promoter_tree = self.promoter_pane(main_tree)
+
+        project_data = {}
+        for field in FIELDS:
+            tree = promoter_tree if field in self.profile.promoter_fields else main_tree
+            validator = is_valid_project_name if field == 'Project Name' else is_valid_value
+            with self.metrics.timer('field', field=field):
+                project_data[field] = self.select_text(tree, self.profile.field_selectors[field], field, validator)
+
+        return clean_project_data(project_data)
+
 
 class EnhancedOdishaRERAScaper:
-    def __init__(self, chromedriver_path):
+    def __init__(self, chromedriver_path, workers=1, max_projects=6, selector_registry=None, fetch_mode='auto',
+                 rate_limit=DEFAULT_RATE_LIMIT, max_in_flight=DEFAULT_MAX_IN_FLIGHT, journal_path=None, resume=False,
+                 state_path=None, incremental=False, sinks=None, keep_records=True, driver_pool=None,
+                 resource_blocker=None, page_cache=None, metrics=None, start_page=1, end_page=None,
+                 retry_policy=None, concurrency=None, extraction='snapshot', extra_fields=False, profile=None,
+                 rate_limiter=None, lean=False, snapshot_archive=None):
         self.chromedriver_path = chromedriver_path
         self.driver = None
-        self.base_url = "https://rera.odisha.gov.in/projects/project-list"
+        self.profile = profile or OdishaProfile()
+        self.base_url = self.profile.base_url
         self.projects_data = []
         self.wait = None
+        self.workers = workers
+        # 0 or None means no cap: crawl every listing page in range
+        self.max_projects = max_projects or float('inf')
+        self.start_page = start_page
+        self.end_page = end_page
+        self.harvested_projects = []
+        self.metrics = metrics or CrawlMetrics()
+        self.selectors = selector_registry or SelectorRegistry()
+        if self.selectors.metrics is None:
+            self.selectors.metrics = self.metrics
+        self.extractor = HtmlProjectExtractor(self.selectors, self.metrics, self.profile)
+        self.fetch_mode = fetch_mode
+        self.max_in_flight = max_in_flight
+        self.page_cache = page_cache
+        self.replay = page_cache is not None and page_cache.replay
+        self.snapshot_archive = snapshot_archive
+        self.current_project = None
+        # Listing page the main tab shows, and the one the last in-place detail click left
+        # behind in history, so click-only projects skip reloading and re-paging the listing
+        self.listing_page = None
+        self.listing_in_history = None
+        self.http = HttpFetcher(pool_size=max(10, max_in_flight), cache=page_cache, metrics=self.metrics)
+        # Shared between portals crawled together; buckets are per host anyway
+        self.rate_limiter = rate_limiter or RateLimiter(rate_limit)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.concurrency = concurrency or AdaptiveConcurrency(max(max_in_flight, workers), metrics=self.metrics)
+        self.last_failure = None
+        self.journal = ProgressJournal(journal_path) if journal_path else None
+        self.resume = resume
+        self.completed = {}
+        self.state = CrawlState(state_path) if state_path else None
+        self.incremental = incremental
+        self.sinks = sinks or []
+        self.sink_lock = threading.Lock()
+        self.keep_records = keep_records
+        self.records_streamed = 0
+        self.resource_blocker = resource_blocker
+        self.resource_reports = []
+        self.owns_driver_pool = driver_pool is None
+        self.driver_pool = driver_pool or create_driver_pool(chromedriver_path, resource_blocker, lean=lean)
+        self.readiness_timeouts = dict(READINESS_TIMEOUTS)
+        self.extraction = extraction
+        self.extra_fields = extra_fields
 
     def setup_driver(self):
-        """Setup Chrome WebDriver with enhanced options"""
+        """Take a (possibly warm) Chrome session from the driver pool"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-images")  # Faster loading
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument(
-                "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
-
-            service = Service(self.chromedriver_path)
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.driver = self.driver_pool.acquire()
             self.wait = WebDriverWait(self.driver, 15)
-
-            logger.info("✅ Chrome WebDriver initialized successfully")
+            self.listing_page = self.listing_in_history = None
             return True
 
         except Exception as e:
             logger.error(f"❌ Failed to setup Chrome WebDriver: {str(e)}")
             return False
 
-    def wait_for_page_load(self, timeout=15):
-        """Enhanced page load waiting with multiple checks"""
+    def replace_driver(self):
+        """Swap the current session for a fresh one (crashed, or due for recycling)"""
+        self.driver = self.driver_pool.replace(self.driver)
+        self.wait = WebDriverWait(self.driver, 15)
+        self.listing_page = self.listing_in_history = None
+
+    def release_driver(self):
+        """Hand the session back to the pool so the next job starts warm"""
+        if self.driver:
+            self.driver_pool.release(self.driver)
+            self.driver = None
+
+    def wait_until(self, name, condition, timeout=None):
+        """Wait for a single readiness condition and record how long it took"""
+        timeout = self.readiness_timeouts.get(name, 10) if timeout is None else timeout
+        start = time.perf_counter()
         try:
-            # Wait for body
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-
-            # Wait for any loading indicators to disappear
-            loading_selectors = [
-                ".loading", ".spinner", "[class*='loading']",
-                ".loader", "[class*='loader']", "#loading"
-            ]
-
-            for selector in loading_selectors:
-                try:
-                    WebDriverWait(self.driver, 3).until_not(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                except:
-                    pass
-
-            # Additional wait for dynamic content
-            time.sleep(3)
-
-            # Wait for JavaScript to complete
-            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(condition)
+            satisfied = True
         except TimeoutException:
-            logger.warning("⚠️ Page load timeout, proceeding anyway")
+            satisfied = False
+        except WebDriverException as e:
+            logger.debug(f"Readiness check {name} failed: {str(e)}")
+            satisfied = False
+
+        elapsed = time.perf_counter() - start
+        self.metrics.observe('wait', elapsed, condition=name)
+        if not satisfied:
+            self.metrics.increment('wait_timeouts', condition=name)
+            logger.warning(f"⚠️ Timed out after {elapsed:.1f}s waiting for {name}")
+        return satisfied
+
+    def install_readiness_probe(self):
+        """Inject the XHR/fetch counter and mutation observer into the current page"""
+        try:
+            self.driver.execute_script(READINESS_PROBE_JS)
+        except WebDriverException as e:
+            logger.debug(f"Could not install readiness probe: {str(e)}")
+
+    @timed('page_load')
+    def wait_for_page_load(self, timeout=None):
+        """Wait until the document, network and DOM have all settled; False if the document never loaded"""
+        loaded = self.wait_until('document',
+                                 lambda driver: driver.execute_script("return document.readyState") == "complete",
+                                 timeout)
+        self.install_readiness_probe()
+
+        # One combined check instead of a separate wait per loading indicator
+        self.wait_until('loading_indicator',
+                        lambda driver: not driver.execute_script(LOADING_VISIBLE_JS, LOADING_SELECTORS))
+        self.wait_until('network_idle', network_idle())
+        self.wait_until('dom_quiet', dom_quiescent())
+        return loaded
+
+    def wait_for_element(self, locator, timeout=None):
+        """Wait until an element matching the locator is present"""
+        return self.wait_until('element', EC.presence_of_element_located(locator), timeout)
+
+    def wait_for_navigation(self, previous_url, previous_handles):
+        """Wait until a click has changed the URL or opened a new window"""
+        return self.wait_until(
+            'navigation',
+            lambda driver: driver.current_url != previous_url or len(driver.window_handles) > previous_handles
+        )
+
+    def wait_for_tab_pane(self, tab):
+        """Wait until the pane controlled by a tab is visible, then for the DOM to settle"""
+        target = tab.get_attribute('data-target') or tab.get_attribute('href') or ''
+        pane_id = target.split('#', 1)[1] if '#' in target else ''
+        if pane_id:
+            shown = self.wait_until('tab_pane', EC.visibility_of_element_located((By.ID, pane_id)))
+        else:
+            shown = self.wait_until('tab_pane', lambda driver: 'active' in (tab.get_attribute('class') or ''))
+        self.wait_until('dom_quiet', dom_quiescent())
+        return shown
+
+    def log_resource_savings(self):
+        """Summarise what resource blocking dropped over the run"""
+        if not self.resource_reports:
+            return
+        pages = len(self.resource_reports)
+        blocked = sum(report['blocked'] for report in self.resource_reports)
+        requests_made = sum(report['requests'] for report in self.resource_reports)
+        transferred = sum(report['bytes'] for report in self.resource_reports)
+        logger.info(f"🚫 Resource blocking: {blocked}/{requests_made} requests blocked over {pages} pages, "
+                    f"{transferred / 1024 / pages:.0f}KB transferred per page")
 
     def find_view_details_elements(self):
         """Enhanced element finding with multiple strategies"""
-        strategies = [
-            # XPath strategies
-            "//a[contains(text(), 'View Details')]",
-            "//button[contains(text(), 'View Details')]",
-            "//a[contains(text(), 'View')]",
-            "//input[@value='View Details']",
-            "//a[contains(@onclick, 'view') or contains(@onclick, 'detail')]",
-
-            # CSS strategies
-            "a[href*='view']",
-            "a[href*='detail']",
-            ".view-btn", ".detail-btn", ".btn-view",
-            "button[onclick*='view']"
-        ]
-
-        for strategy in strategies:
+        for strategy in self.selectors.ordered('View Details', self.profile.view_details_selectors):
+            start = time.perf_counter()
             try:
-                if strategy.startswith("//"):
-                    elements = self.driver.find_elements(By.XPATH, strategy)
-                else:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, strategy)
+                elements = self.driver.find_elements(*self.selectors.locator(strategy))
+                self.selectors.record('View Details', strategy, bool(elements), time.perf_counter() - start)
 
                 if elements:
                     logger.info(f"✅ Found {len(elements)} elements using: {strategy}")
-                    return elements[:6]
+                    return elements
 
             except Exception as e:
+                self.selectors.record('View Details', strategy, False, time.perf_counter() - start)
                 logger.debug(f"Strategy failed: {strategy} - {str(e)}")
                 continue
 
         return []
 
-    def extract_with_multiple_selectors(self, selectors, field_name):
-        """Extract data using multiple selector strategies"""
-        for selector in selectors:
-            try:
-                if selector.startswith("//"):
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                else:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-
-                for element in elements:
-                    text = element.text.strip()
-                    if text and text.lower() not in ['not available', 'n/a', '-', '']:
-                        logger.info(f"✅ Found {field_name}: {text}")
-                        return text
-
-            except Exception as e:
-                logger.debug(f"Selector failed for {field_name}: {selector} - {str(e)}")
-                continue
-
-        return "Not Available"
-
+    @timed('click_promoter_tab')
     def click_promoter_tab(self):
         """FIXED: Enhanced promoter tab clicking with better selectors"""
-        # More comprehensive tab selectors including variations
-        tab_selectors = [
-            "//a[contains(text(), 'Promoter Details')]",
-            "//a[contains(text(), 'Promoter')]",
-            "//button[contains(text(), 'Promoter Details')]",
-            "//button[contains(text(), 'Promoter')]",
-            "//li[contains(text(), 'Promoter Details')]",
-            "//li[contains(text(), 'Promoter')]",
-            "//span[contains(text(), 'Promoter Details')]",
-            "//span[contains(text(), 'Promoter')]",
-            "//*[@id='promoter-tab']",
-            "//*[@href='#promoter']",
-            "//*[@href='#promoter-details']",
-            "//*[contains(@class, 'promoter')]",
-            "a[href*='promoter']",
-            ".nav-link[href*='promoter']",
-            "#promoter-tab",
-            ".tab[data-target*='promoter']",
-            "button[data-toggle='tab'][href*='promoter']"
-        ]
-
-        for selector in tab_selectors:
+        for selector in self.selectors.ordered('Promoter Tab', self.profile.promoter_tab_selectors):
+            start = time.perf_counter()
             try:
-                if selector.startswith("//"):
-                    tabs = self.driver.find_elements(By.XPATH, selector)
-                else:
-                    tabs = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                tabs = self.driver.find_elements(*self.selectors.locator(selector))
 
                 for tab in tabs:
                     if tab and tab.is_displayed():
                         try:
                             # Scroll to element
                             self.driver.execute_script(
-                                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", tab)
-                            time.sleep(1)
+                                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", tab)
 
                             # Try clicking
                             tab.click()
-                            time.sleep(3)
+                            self.wait_for_tab_pane(tab)
+                            self.selectors.record('Promoter Tab', selector, True, time.perf_counter() - start)
                             logger.info("✅ Successfully clicked Promoter Details tab")
                             return True
                         except:
@@ -192,152 +2495,227 @@ class EnhancedOdishaRERAScaper:
 
             except Exception as e:
                 logger.debug(f"Tab selector failed: {selector} - {str(e)}")
-                continue
+
+            self.selectors.record('Promoter Tab', selector, False, time.perf_counter() - start)
 
         logger.warning("⚠️ Could not find or click Promoter Details tab")
         return False
 
+    def extract_with_label_map(self):
+        """Read every label/value pair with one script call per tab state; None if fields are still missing"""
+        try:
+            if not self.wait_for_page_load():
+                self.last_failure = 'timeout'
+            sections = self.driver.execute_script(LABEL_VALUE_JS) or {}
+            promoter_sections = [name for name in sections if 'promoter' in name.lower()]
+            if not promoter_sections:
+                # Promoter details are only rendered once their tab is opened
+                before = sections
+                if self.click_promoter_tab():
+                    sections = self.driver.execute_script(LABEL_VALUE_JS) or {}
+                    promoter_sections = [name for name, values in sections.items() if before.get(name) != values]
+            project_data, extras = self.extractor.from_label_map(sections, promoter_sections)
+        except WebDriverException as e:
+            logger.debug(f"Label map extraction failed: {str(e)}")
+            return None
+
+        if has_missing_fields(project_data):
+            self.metrics.increment('label_map_fallbacks')
+            return None
+        self.metrics.increment('label_map_extractions')
+        if self.extra_fields:
+            project_data['Other Details'] = extras
+        return project_data
+
+    @timed('extract_project_details')
     def extract_project_details(self):
-        """FIXED: Enhanced project details extraction with better selectors"""
-        project_data = {
-            'Rera Regd. No': '',
-            'Project Name': '',
-            'Promoter Name': '',
-            'Address of the Promoter': '',
-            'GST No': ''
-        }
+        """Snapshot the overview and promoter tab once, then extract every field locally"""
+        # Label map first when asked for; snapshots are still needed to fill the page cache and archive
+        if self.extraction == 'js' and not self.page_cache and self.snapshot_archive is None:
+            project_data = self.extract_with_label_map()
+            if project_data is not None:
+                return project_data
 
         try:
-            self.wait_for_page_load()
-
-            # Get page source for BeautifulSoup parsing as backup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-
-            # FIXED: Extract RERA Registration Number
-            rera_selectors = [
-                "//td[contains(text(), 'RERA Registration No') or contains(text(), 'RERA Regd. No') or contains(text(), 'Registration No')]/following-sibling::td[1]",
-                "//th[contains(text(), 'RERA Registration No') or contains(text(), 'RERA Regd. No') or contains(text(), 'Registration No')]/following-sibling::td[1]",
-                "//tr[td[contains(text(), 'RERA Registration No') or contains(text(), 'RERA Regd. No') or contains(text(), 'Registration No')]]/td[2]",
-                "//label[contains(text(), 'RERA')]/following-sibling::*[1]",
-                "//strong[contains(text(), 'RERA')]/parent::*/following-sibling::*[1]",
-                "//*[contains(@class, 'rera-no')]",
-                "//*[@id='rera_no' or @id='registration_no']",
-                ".registration-number", ".rera-number"
-            ]
-            project_data['Rera Regd. No'] = self.extract_with_multiple_selectors(rera_selectors, "RERA No")
-
-            # FIXED: Extract Project Name - look for actual project names, not numbers
-            name_selectors = [
-                # Look in table cells first
-                "//td[contains(text(), 'Project Name')]/following-sibling::td[1]",
-                "//th[contains(text(), 'Project Name')]/following-sibling::td[1]",
-                "//tr[td[contains(text(), 'Project Name')]]/td[2]",
-
-                # Look for headings that are NOT numbers and NOT generic terms
-                "//h1[not(contains(text(), 'RERA')) and not(contains(text(), 'Project List')) and not(contains(text(), 'Projects')) and not(number(text())=text())]",
-                "//h2[not(contains(text(), 'RERA')) and not(contains(text(), 'Project List')) and not(contains(text(), 'Projects')) and not(number(text())=text())]",
-                "//h3[not(contains(text(), 'RERA')) and not(contains(text(), 'Project List')) and not(contains(text(), 'Projects')) and not(number(text())=text())]",
-
-                # Look for specific project name patterns
-                "//*[contains(text(), 'Enclave') or contains(text(), 'Residency') or contains(text(), 'Manor') or contains(text(), 'Villa') or contains(text(), 'Heights') or contains(text(), 'Park') or contains(text(), 'Garden') or contains(text(), 'Tower') or contains(text(), 'Plaza') or contains(text(), 'City') or contains(text(), 'Colony') or contains(text(), 'UDYAYEEN') or contains(text(), 'BARSANA') or contains(text(), 'KRISHNA') or contains(text(), 'BHAVYAVILLA')]",
-
-                "//*[contains(@class, 'project-name')]",
-                "//*[@id='project_name']",
-                ".project-title", ".project-heading"
-            ]
-
-            # Custom extraction for project name to filter out numbers
-            project_name = "Not Available"
-            for selector in name_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                    else:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-
-                    for element in elements:
-                        text = element.text.strip()
-                        # Filter out numbers, generic terms, and short strings
-                        if (text and
-                                not text.isdigit() and  # Not a pure number
-                                text.lower() not in ['projects', 'project', 'not available', 'n/a', '-', '', 'rera',
-                                                     'registration'] and
-                                len(text) > 2 and
-                                not text.startswith('http')):
-                            logger.info(f"✅ Found Project Name: {text}")
-                            project_name = text
-                            break
-
-                    if project_name != "Not Available":
-                        break
-
-                except Exception as e:
-                    logger.debug(f"Project name selector failed: {selector} - {str(e)}")
-                    continue
-
-            project_data['Project Name'] = project_name
-
-            # Click on Promoter Details tab
-            self.click_promoter_tab()
-
-            # FIXED: Extract Promoter Name - handle both "Promoter Name" and "Proprietory Name"
-            promoter_selectors = [
-                "//td[contains(text(), 'Company Name') or contains(text(), 'Promoter Name') or contains(text(), 'Proprietory Name') or contains(text(), 'Propietory Name') or contains(text(), 'Firm Name')]/following-sibling::td[1]",
-                "//th[contains(text(), 'Company Name') or contains(text(), 'Promoter Name') or contains(text(), 'Proprietory Name') or contains(text(), 'Propietory Name')]/following-sibling::td[1]",
-                "//tr[td[contains(text(), 'Company Name') or contains(text(), 'Promoter Name') or contains(text(), 'Proprietory Name') or contains(text(), 'Propietory Name')]]/td[2]",
-                "//label[contains(text(), 'Company') or contains(text(), 'Promoter') or contains(text(), 'Proprietory') or contains(text(), 'Propietory')]/following-sibling::*[1]",
-                "//*[contains(@class, 'promoter-name') or contains(@class, 'company-name')]",
-                "//*[@id='company_name' or @id='promoter_name']",
-                ".company-name", ".promoter-name", ".firm-name"
-            ]
-
-            project_data['Promoter Name'] = self.extract_with_multiple_selectors(promoter_selectors, "Promoter Name")
-
-            # Extract Promoter Address
-            address_selectors = [
-                "//td[contains(text(), 'Registered Office') or contains(text(), 'Address') or contains(text(), 'Office Address')]/following-sibling::td[1]",
-                "//th[contains(text(), 'Registered Office') or contains(text(), 'Address')]/following-sibling::td[1]",
-                "//tr[td[contains(text(), 'Registered Office') or contains(text(), 'Address')]]/td[2]",
-                "//label[contains(text(), 'Registered Office') or contains(text(), 'Address')]/following-sibling::*[1]",
-                "//*[contains(@class, 'promoter-address') or contains(@class, 'office-address')]",
-                "//*[@id='registered_address' or @id='office_address']",
-                ".registered-address", ".office-address", ".promoter-address"
-            ]
-            project_data['Address of the Promoter'] = self.extract_with_multiple_selectors(address_selectors, "Address")
-
-            # Extract GST Number
-            gst_selectors = [
-                "//td[contains(text(), 'GST') or contains(text(), 'GSTIN')]/following-sibling::td[1]",
-                "//th[contains(text(), 'GST') or contains(text(), 'GSTIN')]/following-sibling::td[1]",
-                "//tr[td[contains(text(), 'GST') or contains(text(), 'GSTIN')]]/td[2]",
-                "//label[contains(text(), 'GST') or contains(text(), 'GSTIN')]/following-sibling::*[1]",
-                "//*[contains(@class, 'gst-number') or contains(@class, 'gstin')]",
-                "//*[@id='gst_no' or @id='gstin']",
-                ".gst-number", ".gstin"
-            ]
-            project_data['GST No'] = self.extract_with_multiple_selectors(gst_selectors, "GST No")
-
-            # Clean up data
-            for key, value in project_data.items():
-                if isinstance(value, str):
-                    # Remove extra commas and clean up
-                    cleaned_value = value.replace(',,,,,', '').replace(',,', ',').strip()
-                    if cleaned_value.endswith(','):
-                        cleaned_value = cleaned_value[:-1]
-                    project_data[key] = cleaned_value if cleaned_value else "Not Available"
-
+            if not self.wait_for_page_load():
+                self.last_failure = 'timeout'
+            main_html = self.driver.page_source
+            main_tree = lxml_html.fromstring(main_html)
+
+            # Bootstrap usually pre-renders hidden panes; only click the tab when that was not enough
+            promoter_html = None
+            project_data = None
+            if self.extractor.has_promoter_pane(main_tree):
+                project_data = self.extractor.extract_tree(main_tree)
+                if any(project_data[field] == 'Not Available' for field in self.profile.promoter_fields):
+                    project_data = None
+                else:
+                    self.metrics.increment('promoter_tab_skipped')
+            if project_data is None and self.click_promoter_tab():
+                promoter_html = self.driver.page_source
+
+            if self.current_project:
+                self.cache_snapshot(self.current_project['id'], 'main', main_html)
+                self.cache_snapshot(self.current_project['id'], 'promoter', promoter_html)
+                self.archive_snapshot(self.current_project, main_html, promoter_html)
+
+            if project_data is None:
+                project_data = self.extractor.extract_tree(
+                    main_tree, lxml_html.fromstring(promoter_html) if promoter_html else None)
             return project_data
 
         except Exception as e:
+            self.last_failure = classify_failure(e)
             logger.error(f"❌ Error extracting project details: {str(e)}")
-            return {key: 'Not Available' for key in project_data.keys()}
+            return {key: 'Not Available' for key in FIELDS}
 
-    def click_view_details_by_index(self, index):
-        """Enhanced view details clicking with better error handling"""
+    def scrape_archive(self):
+        """Re-extract every project in the snapshot archive, without the site or a browser"""
+        for snapshot in self.snapshot_archive:
+            try:
+                self.projects_data.append(self.extractor.extract(snapshot['main'], snapshot['promoter']))
+            except (etree.ParserError, ValueError) as e:
+                logger.error(f"❌ Could not extract archived {snapshot['key']}: {str(e)}")
+                self.projects_data.append({key: 'Error' for key in FIELDS})
+        logger.info(f"🗜️ Re-extracted {len(self.projects_data)} projects from {self.snapshot_archive.path}")
+        return bool(self.projects_data)
+
+    def scrape_saved_pages(self, paths):
+        """Extract projects from detail pages saved to disk, without starting a browser"""
+        for path in paths:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.projects_data.append(self.extractor.extract(f.read()))
+            except (OSError, etree.ParserError) as e:
+                logger.error(f"❌ Could not extract {path}: {str(e)}")
+                self.projects_data.append({key: 'Error' for key in FIELDS})
+        return bool(self.projects_data)
+
+    def go_to_next_listing_page(self):
+        """Click the listing's next-page control; returns False on the last page"""
+        for selector in self.selectors.ordered('Next Page', self.profile.next_page_selectors):
+            try:
+                for link in self.driver.find_elements(*self.selectors.locator(selector)):
+                    parent_class = link.find_element(By.XPATH, "..").get_attribute('class') or ''
+                    own_class = link.get_attribute('class') or ''
+                    if not link.is_displayed() or 'disabled' in own_class or 'disabled' in parent_class:
+                        continue
+                    self.driver.execute_script("arguments[0].click();", link)
+                    self.wait_for_page_load()
+                    return True
+            except Exception as e:
+                logger.debug(f"Next page selector failed: {selector} - {str(e)}")
+                continue
+        return False
+
+    def is_last_listing_page(self, page):
+        """True once the crawl has reached the end of its page range (shard)"""
+        return self.end_page is not None and page >= self.end_page
+
+    def open_listing_page(self, page):
+        """Load the project listing and advance to the given 1-based page"""
+        self.listing_page = self.listing_in_history = None
+        self.driver.get(self.base_url)
+        self.wait_for_page_load()
+        for _ in range(page - 1):
+            if not self.go_to_next_listing_page():
+                return False
+        self.listing_page = page
+        return True
+
+    def listing_row_signature(self, element):
+        """RERA number and fingerprint of the listing row holding a View Details element"""
         try:
-            # Navigate back to main page
-            self.driver.get(self.base_url)
+            rows = element.find_elements(By.XPATH, self.profile.listing_row_xpath)
+            return listing_signature(rows[0].text if rows else element.text)
+        except Exception:
+            return None, None
+
+    def listing_shows(self, project):
+        """True if the listing in the main tab has this project's row at its harvested index"""
+        elements = self.find_view_details_elements()
+        return bool(project.get('fingerprint')) and len(elements) > project['index'] and \
+            self.listing_row_signature(elements[project['index']])[1] == project['fingerprint']
+
+    def show_listing_page(self, project):
+        """Bring the main tab to the listing page holding a click-only project, reloading only when lost"""
+        page = project['page']
+        if self.listing_page == page:
+            # The detail page opened in its own window, so the listing never left
+            return True
+        if self.listing_page is None and self.listing_in_history == page:
+            # The detail page replaced the listing in this tab; history often keeps the listing's page
+            self.driver.back()
+            self.wait_for_page_load()
+            self.listing_in_history = None
+            if self.listing_shows(project):
+                self.listing_page = page
+                return True
+        listing_url = project.get('listing_url')
+        if listing_url and listing_url != self.base_url:
+            # Pagination that shows in the address bar: go straight to the page
+            self.driver.get(listing_url)
             self.wait_for_page_load()
+            self.listing_page, self.listing_in_history = page, None
+            return True
+        return self.open_listing_page(page)
+
+    @timed('harvest_listing')
+    def harvest_projects(self):
+        """Walk the listing once and collect a stable identifier for each project"""
+        projects = []
+        seen = set()
+        page = self.start_page
+
+        while len(projects) < self.max_projects:
+            self.cache_snapshot(self.base_url, f"listing-{page}", self.driver.page_source)
+            listing_url = self.driver.current_url
+            new_on_page = 0
+            for index, element in enumerate(self.find_view_details_elements()):
+                try:
+                    href = element.get_attribute('href')
+                except Exception:
+                    href = None
+                url = href if is_navigable_href(href) else None
+                project_id = url or f"page-{page}-item-{index}"
+                if project_id in seen:
+                    continue
+                seen.add(project_id)
+                new_on_page += 1
+                rera, fingerprint = self.listing_row_signature(element)
+                projects.append({'id': project_id, 'page': page, 'index': index, 'url': url,
+                                 'rera': rera, 'fingerprint': fingerprint, 'listing_url': listing_url})
+                if len(projects) >= self.max_projects:
+                    break
+
+            logger.info(f"📄 Harvested {new_on_page} projects from listing page {page}")
+            # Stop when pagination runs out or keeps serving the same rows
+            if len(projects) >= self.max_projects or not new_on_page or self.is_last_listing_page(page) \
+                    or not self.go_to_next_listing_page():
+                break
+            page += 1
+
+        self.listing_page = page
+        return projects
+
+    @timed('open_project')
+    def open_project(self, project):
+        """Navigate to a harvested project's detail page"""
+        if project['url']:
+            self.listing_page = self.listing_in_history = None
+            self.driver.get(project['url'])
+            return True
+        return self.click_view_details_by_index(project)
+
+    @timed('click_view_details')
+    def click_view_details_by_index(self, project):
+        """Enhanced view details clicking with better error handling"""
+        index, page = project['index'], project['page']
+        try:
+            # Get back to the listing page holding this project
+            if not self.show_listing_page(project):
+                logger.error(f"❌ Could not reach listing page {page}")
+                return False
 
             # Re-find elements
             view_details_elements = self.find_view_details_elements()
@@ -349,8 +2727,7 @@ class EnhancedOdishaRERAScaper:
             element = view_details_elements[index]
 
             # Scroll to element
-            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            time.sleep(2)
+            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", element)
 
             # Try multiple click methods
             click_methods = [
@@ -361,12 +2738,16 @@ class EnhancedOdishaRERAScaper:
 
             for i, method in enumerate(click_methods):
                 try:
+                    previous_url = self.driver.current_url
+                    previous_handles = len(self.driver.window_handles)
                     method()
-                    time.sleep(3)
 
                     # Check if navigation was successful
-                    current_url = self.driver.current_url
-                    if current_url != self.base_url or len(self.driver.window_handles) > 1:
+                    if self.wait_for_navigation(previous_url, previous_handles):
+                        if len(self.driver.window_handles) == previous_handles:
+                            self.listing_page, self.listing_in_history = None, page
+                        if i:
+                            self.metrics.increment('click_fallbacks', method=i + 1)
                         logger.info(f"✅ Successfully clicked View Details for project {index + 1}")
                         return True
 
@@ -377,10 +2758,11 @@ class EnhancedOdishaRERAScaper:
             # Try direct navigation if href is available
             try:
                 href = element.get_attribute('href')
-                if href and href not in ['javascript:void(0)', '#', '']:
+                if is_navigable_href(href):
+                    self.metrics.increment('click_fallbacks', method='direct')
                     logger.info(f"🔗 Navigating directly to: {href}")
+                    self.listing_page, self.listing_in_history = None, page
                     self.driver.get(href)
-                    time.sleep(3)
                     return True
             except:
                 pass
@@ -391,68 +2773,465 @@ class EnhancedOdishaRERAScaper:
             logger.error(f"❌ Error clicking view details for index {index}: {str(e)}")
             return False
 
-    def scrape_projects(self):
-        """Main scraping function with enhanced error handling"""
-        if not self.setup_driver():
-            return False
-
+    @timed('project')
+    def scrape_project(self, index, project, total):
+        """Open and extract a single harvested project, replacing the browser if it died on the way"""
+        record = self.scrape_project_once(index, project, total)
+        if has_missing_fields(record) and not is_healthy(self.driver):
+            logger.warning(f"💥 Chrome session died on project {index + 1}; replacing it")
+            self.metrics.increment('session_retries')
+            self.last_failure = 'driver_crash'
+            self.replace_driver()
+
+        self.driver_pool.record_page(self.driver)
+        if self.driver_pool.needs_recycle(self.driver):
+            self.metrics.increment('session_recycles')
+            self.replace_driver()
+        return record
+
+    def scrape_project_once(self, index, project, total):
+        """Open and extract a single harvested project; failures are noted in last_failure"""
+        self.current_project = project
+        self.last_failure = None
         try:
-            logger.info("🚀 Starting to scrape projects...")
-            self.driver.get(self.base_url)
-            self.wait_for_page_load()
+            logger.info(f"🔄 Processing project {index + 1}/{total}")
 
-            # Find available projects
-            view_details_elements = self.find_view_details_elements()
-            if not view_details_elements:
-                logger.error("❌ No projects found on the page")
-                return False
+            main_window = self.driver.current_window_handle
 
-            num_projects = min(6, len(view_details_elements))
-            logger.info(f"📋 Found {len(view_details_elements)} projects, will scrape {num_projects}")
+            if not self.open_project(project):
+                self.last_failure = 'navigation'
+                logger.warning(f"⚠️ Could not access details for project {index + 1}")
+                return {key: 'Not Available' for key in FIELDS}
 
-            # Process each project
-            for i in range(num_projects):
-                try:
-                    logger.info(f"🔄 Processing project {i + 1}/{num_projects}")
+            # Handle new window if opened
+            if len(self.driver.window_handles) > 1:
+                for handle in self.driver.window_handles:
+                    if handle != main_window:
+                        self.driver.switch_to.window(handle)
+                        break
 
-                    main_window = self.driver.current_window_handle
+            # Detail content is there as soon as its promoter tab or pane is, often before the page settles
+            if not self.wait_for_element((By.XPATH, self.profile.detail_ready_xpath)):
+                self.last_failure = 'timeout'
 
-                    if self.click_view_details_by_index(i):
-                        # Handle new window if opened
-                        if len(self.driver.window_handles) > 1:
-                            for handle in self.driver.window_handles:
-                                if handle != main_window:
-                                    self.driver.switch_to.window(handle)
-                                    break
+            # Extract project details
+            project_data = self.extract_project_details()
 
-                        # Extract project details
-                        project_data = self.extract_project_details()
-                        self.projects_data.append(project_data)
+            # Close new window if opened
+            if len(self.driver.window_handles) > 1:
+                self.driver.close()
+                self.driver.switch_to.window(main_window)
 
-                        # Close new window if opened
-                        if len(self.driver.window_handles) > 1:
-                            self.driver.close()
-                            self.driver.switch_to.window(main_window)
+            if self.resource_blocker:
+                report = self.resource_blocker.page_report(self.driver)
+                self.resource_reports.append(report)
+                logger.info(f"🚫 Project {index + 1}: {report['requests']} requests, "
+                            f"{report['bytes'] / 1024:.0f}KB transferred, {report['blocked']} blocked "
+                            f"{report['blocked_by_type'] or ''}")
 
-                    else:
-                        logger.warning(f"⚠️ Could not access details for project {i + 1}")
-                        # Add placeholder data
-                        placeholder_data = {key: 'Not Available' for key in
-                                            ['Rera Regd. No', 'Project Name', 'Promoter Name',
-                                             'Address of the Promoter', 'GST No']}
-                        self.projects_data.append(placeholder_data)
+            return project_data
 
-                    time.sleep(2)  # Be respectful to the server
+        except Exception as e:
+            self.last_failure = classify_failure(e)
+            logger.error(f"❌ Error processing project {index + 1}: {str(e)}")
+            return {key: 'Error' for key in FIELDS}
+
+    def failure_kind(self, record):
+        """Why a scraped record is unusable, or None if any field came through"""
+        if any(value not in ('Not Available', 'Error') for value in record.values()):
+            return None
+        return self.last_failure or 'empty_extraction'
+
+    def drain_work(self, deferred, total, results, owner):
+        """Scrape (position, project, attempt) items from a deferred queue, pushing retryable failures back
+        with backoff; owner holds the shared rate limiter, retry policy, concurrency cap and sinks"""
+        while True:
+            item = deferred.pop()
+            if item is None:
+                break
+            index, project, attempt = item
+            try:
+                owner.concurrency.acquire()
+                try:
+                    owner.rate_limiter.wait(project['url'] or self.base_url)
+                    record = self.scrape_project(index, project, total)
+                finally:
+                    owner.concurrency.release()
+                kind = self.failure_kind(record)
+                owner.concurrency.record(kind)
+
+                if kind and owner.retry_policy.should_retry(kind, attempt):
+                    delay = owner.retry_policy.delay(attempt)
+                    self.metrics.increment('retries', kind=kind)
+                    logger.info(f"🔁 Retrying project {index + 1} ({kind}) in {delay:.1f}s")
+                    deferred.push((index, project, attempt + 1), delay)
+                    continue
+                if kind:
+                    self.metrics.increment('failed_projects', kind=kind)
+                results[index] = owner.finish_record(project, record)
+            finally:
+                deferred.done()
+
+    def scrape_with_worker_pool(self, work, total):
+        """Scrape (position, project) pairs with a pool of browser sessions pulling from a shared queue"""
+        if self.driver and self.listing_page is not None:
+            # A browser-harvested listing is still loaded, so this is a real working size, lean or not.
+            # After an HTTP harvest the session has shown nothing yet and the default budget stands
+            self.driver_pool.measure(self.driver)
+        worker_count = min(max_worker_count(self.workers, self.driver_pool.session_memory_mb), len(work))
+        logger.info(f"👷 Starting {worker_count} browser workers for {len(work)} projects")
+
+        pending = DeferredQueue((index, project, 1) for index, project in work)
+        results = {}
+
+        def run_worker(worker_id):
+            worker = self.__class__(self.chromedriver_path, selector_registry=self.selectors,
+                                    driver_pool=self.driver_pool, resource_blocker=self.resource_blocker,
+                                    page_cache=self.page_cache, metrics=self.metrics, extraction=self.extraction,
+                                    extra_fields=self.extra_fields, profile=self.profile,
+                                    snapshot_archive=self.snapshot_archive)
+            if not worker.setup_driver():
+                logger.error(f"❌ Worker {worker_id} could not start a browser")
+                return
+            try:
+                worker.drain_work(pending, total, results, self)
+            finally:
+                worker.release_driver()
+                self.resource_reports.extend(worker.resource_reports)
+
+        threads = [threading.Thread(target=run_worker, args=(n + 1,), name=f"rera-worker-{n + 1}")
+                   for n in range(worker_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Anything no worker could reach is an error row
+        for index, project in work:
+            if index not in results:
+                results[index] = self.finish_record(project, {key: 'Error' for key in FIELDS})
+        return results
+
+    def iter_listing_http(self):
+        """Walk the listing over plain HTTP, yielding projects lazily; yields nothing when links need JavaScript"""
+        seen = set()
+        page = 1
+        url = self.base_url
+
+        while len(seen) < self.max_projects:
+            html = None
+            if url:
+                html = self.fetch_listing_page(url)
+            if html is None and self.page_cache:
+                # Listing pages captured by a browser run, where pagination is driven by JavaScript
+                html = self.page_cache.get(self.base_url, f"listing-{page}")
+            if not html:
+                break
+            tree = lxml_html.fromstring(html)
+            tree.make_links_absolute(url or self.base_url)
+
+            if page < self.start_page:
+                # Before this shard's range: jump straight to the start page when the link shows page numbers
+                url = self.next_listing_url(tree)
+                jump = listing_page_url(url, page + 1, self.start_page) if url else None
+                url, page = (jump, self.start_page) if jump else (url, page + 1)
+                if url is None and not (self.page_cache and
+                                        self.page_cache.contains(self.base_url, f"listing-{page}")):
+                    break
+                continue
 
+            new_on_page = 0
+            for selector in self.selectors.ordered('View Details', self.profile.view_details_selectors):
+                elements = self.extractor.compile_selector(selector)(tree)
+                if not elements:
+                    continue
+                for index, element in enumerate(elements):
+                    href = element.get('href')
+                    project_id = href if is_navigable_href(href) else f"page-{page}-item-{index}"
+                    if project_id != href and not (self.page_cache and self.page_cache.contains(project_id)):
+                        # Click-only target: reachable over HTTP only through a cached browser snapshot
+                        continue
+                    if project_id in seen or len(seen) >= self.max_projects:
+                        continue
+                    seen.add(project_id)
+                    new_on_page += 1
+                    rows = element.xpath(self.profile.listing_row_xpath)
+                    rera, fingerprint = listing_signature(' '.join((rows[0] if rows else element).itertext()))
+                    yield {'id': project_id, 'page': page, 'index': index,
+                           'url': href if project_id == href else None, 'rera': rera, 'fingerprint': fingerprint,
+                           'listing_url': url or self.base_url}
+                if new_on_page:
+                    break
+
+            logger.info(f"🌐 Harvested {new_on_page} projects from listing page {page} over HTTP")
+            if not new_on_page or self.is_last_listing_page(page):
+                break
+
+            url = self.next_listing_url(tree)
+            page += 1
+            if url is None and not (self.page_cache and self.page_cache.contains(self.base_url, f"listing-{page}")):
+                break
+
+    def next_listing_url(self, tree):
+        """Absolute URL of the listing's next page in a parsed page, or None on the last page"""
+        for selector in self.profile.next_page_selectors:
+            hrefs = [link.get('href') for link in self.extractor.compile_selector(selector)(tree)
+                     if 'disabled' not in (link.getparent().get('class') or '')]
+            hrefs = [href for href in hrefs if is_navigable_href(href)]
+            if hrefs:
+                return hrefs[0]
+        return None
+
+    def fetch_detail_pages(self, project):
+        """(overview HTML, promoter tab HTML or None, failure kind or None) over HTTP or from the page cache"""
+        promoter_html = None
+        if self.page_cache and self.page_cache.contains(project['id'], 'promoter'):
+            promoter_html = self.page_cache.get(project['id'], 'promoter')
+        if project['url']:
+            main_html, failure = self.http.fetch(project['url'])
+            if main_html:
+                self.archive_snapshot(project, main_html, promoter_html, source='http')
+            return main_html, promoter_html, failure
+        main_html = self.page_cache.get(project['id']) if self.page_cache else None
+        return main_html, promoter_html, None if main_html else 'navigation'
+
+    def fetch_listing_page(self, url):
+        """Fetch a listing page, retrying transient failures in place since pagination depends on it"""
+        attempt = 1
+        while True:
+            if not self.http.cached(url):
+                self.rate_limiter.wait(url)
+            html, failure = self.http.fetch(url)
+            if not failure or not self.retry_policy.should_retry(failure, attempt):
+                return html
+            self.metrics.increment('retries', kind=failure)
+            time.sleep(self.retry_policy.delay(attempt))
+            attempt += 1
+
+    def cache_snapshot(self, key, tab, html):
+        """Keep a browser snapshot so later runs can replay it without the site"""
+        if self.page_cache and html and not self.page_cache.replay:
+            self.page_cache.put(key, html, tab)
+
+    def archive_snapshot(self, project, main_html, promoter_html=None, source='browser'):
+        """Add a project's pages to the snapshot archive, keeping only the promoter pane of the clicked tab"""
+        if self.snapshot_archive is None or not main_html:
+            return
+        if promoter_html:
+            promoter_html = self.extractor.pane_snapshot(promoter_html)
+        self.snapshot_archive.put(project['id'], main_html, promoter_html, url=project.get('url'), source=source,
+                                  page=project.get('page'), index=project.get('index'))
+
+    def enqueue_projects(self, work_queue):
+        """Coordinator: harvest the listing into the shared queue; known records go in as already done"""
+        added = 0
+        projects = self.iter_listing_http() if self.fetch_mode != 'browser' or self.replay else iter(())
+        for project in projects:
+            added += work_queue.push(project, self.known_record(project))
+
+        if not added and self.fetch_mode != 'http' and not self.replay and self.setup_driver():
+            # Listing needs JavaScript: harvest it with the browser instead
+            try:
+                if self.open_listing_page(self.start_page):
+                    for project in self.harvest_projects():
+                        added += work_queue.push(project, self.known_record(project))
+            finally:
+                self.release_driver()
+
+        logger.info(f"📮 Queued {added} new projects in {work_queue.path}: {work_queue.counts()}")
+        return added > 0
+
+    def scrape_queued_project(self, position, project, total):
+        """HTTP first, the browser only if fields are still missing"""
+        record = None
+        if self.fetch_mode != 'browser' or self.replay:
+            if project['url'] and not self.http.cached(project['url']):
+                self.rate_limiter.wait(project['url'])
+            main_html, promoter_html, _ = self.fetch_detail_pages(project)
+            if main_html:
+                try:
+                    record = self.extractor.extract(main_html, promoter_html)
                 except Exception as e:
-                    logger.error(f"❌ Error processing project {i + 1}: {str(e)}")
-                    # Add error data entry
-                    error_data = {key: 'Error' for key in
-                                  ['Rera Regd. No', 'Project Name', 'Promoter Name',
-                                   'Address of the Promoter', 'GST No']}
-                    self.projects_data.append(error_data)
+                    logger.error(f"❌ Error extracting project {position}: {str(e)}")
+
+        if (record is None or has_missing_fields(record)) and self.fetch_mode != 'http' and not self.replay:
+            if self.driver is None and not self.setup_driver():
+                return record or {key: 'Error' for key in FIELDS}
+            self.rate_limiter.wait(project['url'] or self.base_url)
+            record = self.scrape_project(position - 1, project, total)
+
+        return record or {key: 'Error' for key in FIELDS}
+
+    def work_from_queue(self, work_queue, worker_id):
+        """Worker: claim and scrape projects until the shared queue is drained; returns how many were finished"""
+        finished = 0
+        logger.info(f"👷 Worker {worker_id} pulling from {work_queue.path}")
+        try:
+            while True:
+                claimed = work_queue.claim(worker_id)
+                if claimed is None:
+                    if not work_queue.outstanding():
+                        break
+                    # Other workers hold leases; wait in case one expires
+                    time.sleep(QUEUE_POLL_SECONDS)
                     continue
 
+                position, project = claimed
+                record = self.scrape_queued_project(position, project, sum(work_queue.counts().values()))
+                if all(value == 'Error' for value in record.values()):
+                    work_queue.fail(position)
+                    continue
+                work_queue.complete(position, project, self.finish_record(project, record) or record, worker_id)
+                finished += 1
+        finally:
+            self.release_driver()
+            for sink in self.sinks:
+                sink.close()
+            if self.owns_driver_pool:
+                self.driver_pool.close()
+            self.selectors.save()
+
+        logger.info(f"🏁 Worker {worker_id} finished {finished} projects; queue: {work_queue.counts()}")
+        return True
+
+    def collect_from_queue(self, work_queue):
+        """Load the deduplicated results gathered by all workers"""
+        self.projects_data = work_queue.records()
+        logger.info(f"📥 Collected {len(self.projects_data)} unique projects; queue: {work_queue.counts()}")
+        return bool(self.projects_data)
+
+    def known_record(self, project):
+        """Record that need not be fetched again: journaled in a resumed run, or unchanged since the last run"""
+        if project['id'] in self.completed:
+            return self.completed[project['id']]
+        if self.state and self.incremental:
+            record = self.state.unchanged_record(project)
+            if record is not None:
+                project['carried_forward'] = True
+            return record
+        return None
+
+    def finish_record(self, project, record, journal=True):
+        """Journal a finished record and stream it to the sinks; returns what projects_data should hold"""
+        # Error rows are left out of the journal so a resumed run retries them
+        if journal and self.journal and any(value != 'Error' for value in record.values()):
+            self.journal.append(project['id'], record)
+        if self.state and project['id'] is not None:
+            self.state.remember(project, record)
+        if self.sinks:
+            with self.sink_lock:
+                for sink in self.sinks:
+                    sink.write(record)
+                self.records_streamed += 1
+        return record if self.keep_records else None
+
+    def scrape_projects(self):
+        """Main scraping function: lightweight HTTP first, browser for whatever it cannot fill"""
+        logger.info("🚀 Starting to scrape projects...")
+        self.projects_data = []
+        self.harvested_projects = []
+
+        self.completed = {}
+        if self.journal:
+            if self.resume:
+                self.completed = self.journal.load()
+                logger.info(f"⏩ Resuming: {len(self.completed)} projects already done in {self.journal.path}")
+            else:
+                self.journal.reset()
+
+        try:
+            return self.run_scrape()
+        finally:
+            for sink in self.sinks:
+                sink.close()
+            if self.owns_driver_pool:
+                self.driver_pool.close()
+            self.metrics.log_summary(stages=('wait', 'page_load', 'click_view_details', 'click_promoter_tab',
+                                             'extract_project_details', 'project', 'http_fetch'))
+            self.log_resource_savings()
+            self.selectors.log_summary()
+            self.selectors.save()
+            if self.page_cache:
+                self.page_cache.log_summary()
+            if self.state and self.harvested_projects:
+                carried = sum(1 for project in self.harvested_projects if project.get('carried_forward'))
+                logger.info(f"♻️ Carried forward {carried} unchanged projects, "
+                            f"fetched {len(self.harvested_projects) - carried} new or changed")
+                self.state.save()
+
+    def run_scrape(self):
+        """HTTP pipeline first, then the browser for anything it could not fill"""
+        fallback = None
+
+        if self.fetch_mode != 'browser' or self.replay:
+            pipeline = AsyncCrawlPipeline(self, self.max_in_flight)
+            self.harvested_projects, self.projects_data = asyncio.run(pipeline.run())
+            if self.harvested_projects:
+                total = len(self.harvested_projects)
+                fallback = [i for i, record in enumerate(self.projects_data)
+                            if record is not None and has_missing_fields(record)
+                            and self.known_record(self.harvested_projects[i]) is None]
+                logger.info(f"🌐 HTTP filled {total - len(fallback)}/{total} projects completely")
+                self.metrics.increment('browser_fallbacks', len(fallback))
+                if not fallback or self.fetch_mode == 'http' or self.replay:
+                    return True
+            elif self.fetch_mode == 'http' or self.replay:
+                logger.error("❌ No projects found over HTTP or in the page cache")
+                return False
+
+        return self.scrape_projects_with_browser(fallback)
+
+    def scrape_projects_with_browser(self, positions=None):
+        """Scrape with Selenium, either everything or only the given harvested positions"""
+        work = [(i, self.harvested_projects[i]) for i in positions or []]
+        finished = set()
+
+        if not self.setup_driver():
+            # Keep whatever the HTTP pass managed to extract
+            for i, project in work:
+                self.projects_data[i] = self.finish_record(project, self.projects_data[i])
+            return bool(self.harvested_projects)
+
+        try:
+            if not self.harvested_projects:
+                if not self.open_listing_page(self.start_page):
+                    logger.error(f"❌ Could not reach listing page {self.start_page}")
+                    return False
+
+                # Collect every project's detail link up front so the listing is only walked once
+                self.harvested_projects = self.harvest_projects()
+                if not self.harvested_projects:
+                    logger.error("❌ No projects found on the page")
+                    return False
+                self.projects_data = [None] * len(self.harvested_projects)
+
+            num_projects = len(self.harvested_projects)
+            if positions is None:
+                for i, project in enumerate(self.harvested_projects):
+                    known = self.known_record(project)
+                    if known is not None:
+                        self.projects_data[i] = self.finish_record(project, known, journal=False)
+                    else:
+                        work.append((i, project))
+                direct = sum(1 for project in self.harvested_projects if project['url'])
+                logger.info(f"📋 Harvested {num_projects} projects ({direct} with direct detail links)")
+            else:
+                logger.info(f"🖥️ Falling back to the browser for {len(positions)} projects")
+
+            # Process each project
+            if self.workers > 1:
+                for i, record in self.scrape_with_worker_pool(work, num_projects).items():
+                    self.projects_data[i] = record
+                    finished.add(i)
+            else:
+                results = {}
+                try:
+                    self.drain_work(DeferredQueue((i, project, 1) for i, project in work), num_projects, results, self)
+                finally:
+                    for i, record in results.items():
+                        self.projects_data[i] = record
+                        finished.add(i)
+
             return True
 
         except Exception as e:
@@ -460,8 +3239,34 @@ class EnhancedOdishaRERAScaper:
             return False
 
         finally:
-            if self.driver:
-                self.driver.quit()
+            for i, project in work:
+                if i not in finished:
+                    self.projects_data[i] = self.finish_record(project, {key: 'Error' for key in FIELDS})
+            self.release_driver()
+
+    def write_to_sinks(self):
+        """Send already collected records (saved pages, queue results) to the sinks and close them"""
+        for record in self.projects_data:
+            if record:
+                self.finish_record({'id': None}, record, journal=False)
+        for sink in self.sinks:
+            sink.close()
+
+    def normalize_results(self):
+        """Normalize and deduplicate the collected records as one DataFrame and log what changed"""
+        records = [record for record in self.projects_data if record]
+        if not records:
+            return False
+        with self.metrics.timer('normalize'):
+            df, stats = normalize_records(pd.DataFrame(records))
+        self.projects_data = df.to_dict('records')
+        logger.info(f"🧹 Normalized {stats['rows']} records: {stats['rera_canonicalized']} RERA numbers "
+                    f"canonicalized, {stats['promoters_merged']} promoter names merged into {stats['promoters']} "
+                    f"promoters, {stats['duplicates_removed']} duplicate projects removed")
+        if stats['rera_invalid'] or stats['gstin_invalid']:
+            logger.warning(f"⚠️ {stats['rera_invalid']} malformed RERA numbers, "
+                           f"{stats['gstin_invalid']} GSTINs failing the format or checksum check")
+        return True
 
     def save_to_excel(self, filename="odisha_rera_projects_fixed.xlsx"):
         """Save data to Excel with enhanced formatting"""
@@ -480,18 +3285,42 @@ class EnhancedOdishaRERAScaper:
                 workbook = writer.book
                 worksheet = writer.sheets['RERA Projects']
 
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+                # Auto-adjust column widths from the longest value per column, computed column-wise
+                lengths = df.astype(str).apply(lambda column: column.str.len().max())
+                for number, column in enumerate(df.columns, 1):
+                    max_length = max(len(str(column)), int(lengths[column]))
+                    worksheet.column_dimensions[get_column_letter(number)].width = min(max_length + 2, 50)
+
+            logger.info(f"✅ Data saved to {filename}")
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Error saving to Excel: {str(e)}")
+            return False
+
+    def save_to_excel_from_stream(self, jsonl_path, filename="odisha_rera_projects_fixed.xlsx"):
+        """Build the Excel export from a JSON Lines stream without loading it into memory"""
+        try:
+            # First pass: column widths, since write-only sheets need them before any row
+            widths = {field: len(field) for field in FIELDS}
+            with open(jsonl_path, encoding='utf-8') as f:
+                for line in f:
+                    record = json.loads(line)
+                    for field in FIELDS:
+                        widths[field] = max(widths[field], len(str(record.get(field, ''))))
+
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet('RERA Projects')
+            for number, field in enumerate(FIELDS, 1):
+                worksheet.column_dimensions[get_column_letter(number)].width = min(widths[field] + 2, 50)
+            worksheet.append(FIELDS)
+
+            # Second pass: stream the rows
+            with open(jsonl_path, encoding='utf-8') as f:
+                for line in f:
+                    record = json.loads(line)
+                    worksheet.append([record.get(field) for field in FIELDS])
+            workbook.save(filename)
 
             logger.info(f"✅ Data saved to {filename}")
             return True
@@ -576,45 +3405,275 @@ class EnhancedOdishaRERAScaper:
         print("📈 EXTRACTION SUMMARY")
         print("=" * 100)
 
-        fields = ['Rera Regd. No', 'Project Name', 'Promoter Name', 'Address of the Promoter', 'GST No']
-        for field in fields:
-            available_count = sum(1 for project in self.projects_data
-                                  if project.get(field, 'Not Available') not in ['Not Available', 'Error'])
-            percentage = (available_count / len(self.projects_data)) * 100 if self.projects_data else 0
-            print(f"{field:<30}: {available_count}/{len(self.projects_data)} ({percentage:.1f}%)")
+        report = coverage_report(pd.DataFrame(self.projects_data))
+        for field, row in report.iterrows():
+            print(f"{field:<30}: {int(row['available'])}/{int(row['total'])} ({row['percentage']:.1f}%)")
 
 
-def main():
-    """Main execution function"""
+def parse_args():
+    """Parse command line options"""
     # Chrome WebDriver path - UPDATE THIS PATH
     CHROMEDRIVER_PATH = "/Users/jhanaviagarwal/Downloads/chromedriver-mac-arm64/chromedriver"
 
-    print("🚀 FIXED Odisha RERA Projects Scraper")
-    print("=" * 60)
+    parser = argparse.ArgumentParser(description="Odisha RERA Projects Scraper")
+    parser.add_argument("--chromedriver", default=CHROMEDRIVER_PATH, help="Path to the chromedriver binary")
+    parser.add_argument("--site", nargs='+', default=[DEFAULT_SITE], metavar="SITE",
+                        help=f"Portal(s) to crawl: built-in profile name ({', '.join(SITE_PROFILES)}) or a "
+                             "JSON/YAML profile file; several run concurrently under one rate limiter")
+    parser.add_argument("--max-projects", type=int, default=6,
+                        help="Stop after this many projects (0 crawls every listing page)")
+    parser.add_argument("--start-page", type=int, default=1,
+                        help="First listing page to crawl (1-based)")
+    parser.add_argument("--end-page", type=int, metavar="PAGE",
+                        help="Last listing page to crawl; with --start-page, shards the listing across machines")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of parallel browser sessions (capped by CPU and free memory)")
+    parser.add_argument("--fetch-mode", choices=['auto', 'http', 'browser'], default='auto',
+                        help="auto: plain HTTP first, Selenium only for pages it cannot fill")
+    parser.add_argument("--extraction", choices=['snapshot', 'js'], default='snapshot',
+                        help="Browser pages: parse HTML snapshots locally, or collect every label/value pair "
+                             "with one in-page script call (falls back to snapshots if fields are missing)")
+    parser.add_argument("--extra-fields", action="store_true",
+                        help="With --extraction js, keep unmapped label/value pairs under 'Other Details'")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE_LIMIT,
+                        help="Maximum sustained requests per second per host (0 disables the limit)")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                        help="Maximum concurrent HTTP detail fetches")
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS_PER_PROJECT,
+                        help="Attempts per project for timeouts, crashes, server errors and empty pages")
+    parser.add_argument("--retry-delay", type=float, default=DEFAULT_RETRY_BASE_DELAY, metavar="SECONDS",
+                        help="Base delay for exponential backoff (with jitter) between attempts")
+    parser.add_argument("--journal", default="scrape_progress.jsonl", metavar="FILE",
+                        help="Append-only progress journal of completed projects")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip projects already completed in the journal instead of starting over")
+    parser.add_argument("--state", default="crawl_state.json", metavar="FILE",
+                        help="Listing fingerprints and records kept between runs for incremental crawls")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only fetch projects that are new or whose listing row changed since the last run")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write each record to CSV and JSON Lines as soon as it is extracted instead of "
+                             "keeping everything in memory; Excel is built from the stream afterwards")
+    parser.add_argument("--parquet", action="store_true",
+                        help="Also write typed Parquet row groups as records finish (requires pyarrow)")
+    parser.add_argument("--no-normalize", action="store_true",
+                        help="Save records as extracted, without the batch cleanup, validation and deduplication")
+    parser.add_argument("--store", metavar="FILE",
+                        help="Upsert records by RERA number into an indexed SQLite store "
+                             "(or DuckDB for a .duckdb path, requires duckdb)")
+    parser.add_argument("--block-types", default=','.join(DEFAULT_BLOCKED_RESOURCE_TYPES),
+                        help="Comma-separated resource types the browser should not download "
+                             f"({', '.join(RESOURCE_TYPE_PATTERNS)})")
+    parser.add_argument("--block-urls", nargs='*', default=[], metavar="PATTERN",
+                        help="Extra URL patterns to block, e.g. '*cdn.example.com/banners*'")
+    parser.add_argument("--no-block", action="store_true", help="Load every resource the pages request")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="Cache fetched pages and browser snapshots on disk (gzip, keyed by URL and tab)")
+    parser.add_argument("--cache-ttl", type=float, default=24, metavar="HOURS",
+                        help="Refetch cached pages older than this")
+    parser.add_argument("--cache-max-mb", type=int, default=500,
+                        help="Evict least recently used cache entries beyond this size")
+    parser.add_argument("--replay", action="store_true",
+                        help="Serve every page from the cache (default dir page_cache) and never touch the site")
+    parser.add_argument("--repeat-every", type=float, metavar="MINUTES",
+                        help="Keep running, starting a new scrape every MINUTES with warm browser sessions")
+    parser.add_argument("--session-max-pages", type=int, default=DEFAULT_SESSION_MAX_PAGES,
+                        help="Restart a browser session after this many project pages")
+    parser.add_argument("--session-max-memory-mb", type=int, metavar="MB",
+                        help="Restart a browser session once its processes' PSS exceeds this "
+                             "(by default only growth is limited)")
+    parser.add_argument("--lean", action="store_true",
+                        help="Headless, GPU-less Chrome with a capped JS heap and small window, "
+                             "so more sessions fit per host")
+    parser.add_argument("--metrics-json", default="run_metrics.json", metavar="FILE",
+                        help="Write stage timings (with p50/p90/p99) and counters to this JSON run report")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="Serve Prometheus metrics on http://localhost:PORT/metrics while running")
+    parser.add_argument("--queue", metavar="FILE",
+                        help="Shared SQLite work queue for distributed crawls (see --role)")
+    parser.add_argument("--role", choices=['coordinator', 'worker', 'collect'],
+                        help="coordinator: queue the listing; worker: scrape queued projects; "
+                             "collect: write the deduplicated results")
+    parser.add_argument("--worker-id", default=f"{socket.gethostname()}-{os.getpid()}",
+                        help="Name recorded with leases and results")
+    parser.add_argument("--lease-seconds", type=int, default=DEFAULT_LEASE_SECONDS,
+                        help="A claimed project is handed to another worker if not finished within this")
+    parser.add_argument("--selector-stats", default="selector_stats.json", metavar="FILE",
+                        help="Where learned selector hit rates are kept between runs")
+    parser.add_argument("--from-html", nargs='+', metavar="FILE",
+                        help="Extract from saved detail pages instead of crawling the live site")
+    parser.add_argument("--archive", metavar="FILE",
+                        help="Append every captured detail page (overview plus promoter pane) to a compressed "
+                             "snapshot archive")
+    parser.add_argument("--from-archive", metavar="FILE",
+                        help="Re-extract every project in a snapshot archive instead of crawling the live site")
+    args = parser.parse_args()
+    if bool(args.queue) != bool(args.role):
+        parser.error("--queue and --role must be used together")
+    if len(args.site) > 1 and (args.queue or args.from_html or args.from_archive):
+        parser.error("--queue, --from-html and --from-archive work on one --site at a time")
+    try:
+        args.profiles = [load_site_profile(site) for site in args.site]
+    except (OSError, ValueError, ImportError) as e:
+        parser.error(f"--site: {str(e)}")
+    names = [profile.name for profile in args.profiles]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        parser.error(f"--site: several profiles are named {', '.join(duplicates)}; their outputs would collide")
+    if args.from_archive and not os.path.exists(args.from_archive):
+        parser.error(f"--from-archive: {args.from_archive} does not exist")
+    if args.start_page < 1 or (args.end_page is not None and args.end_page < args.start_page):
+        parser.error("--start-page must be at least 1 and no greater than --end-page")
+    return args
+
+
+def run_job(args, driver_pool, resource_blocker, page_cache, metrics, profile=None, rate_limiter=None):
+    """Run one scrape of one portal and write its outputs"""
+    profile = profile or OdishaProfile()
+    prefix = profile.output_prefix
+    sinks = []
+    if args.stream:
+        sinks = [CsvSink(f"{prefix}.csv"), JsonLinesSink(f"{prefix}.jsonl")]
+    if args.parquet:
+        sinks.append(ParquetSink(f"{prefix}.parquet"))
+    if args.store:
+        sinks.append(ProjectStore(args.store))
+    snapshot_archive = None
+    if args.from_archive or args.archive:
+        snapshot_archive = SnapshotArchive(args.from_archive or profile.path_for(args.archive))
 
     # Create scraper instance
-    scraper = EnhancedOdishaRERAScaper(CHROMEDRIVER_PATH)
+    scraper = EnhancedOdishaRERAScaper(args.chromedriver, workers=args.workers, max_projects=args.max_projects,
+                                       selector_registry=SelectorRegistry(profile.path_for(args.selector_stats)),
+                                       fetch_mode=args.fetch_mode, rate_limit=args.rate,
+                                       max_in_flight=args.max_in_flight, journal_path=profile.path_for(args.journal),
+                                       resume=args.resume, state_path=profile.path_for(args.state),
+                                       incremental=args.incremental, sinks=sinks, keep_records=not args.stream,
+                                       driver_pool=driver_pool, resource_blocker=resource_blocker,
+                                       page_cache=page_cache, metrics=metrics,
+                                       start_page=args.start_page, end_page=args.end_page,
+                                       retry_policy=RetryPolicy(args.max_attempts, args.retry_delay),
+                                       extraction=args.extraction, extra_fields=args.extra_fields,
+                                       profile=profile, rate_limiter=rate_limiter, snapshot_archive=snapshot_archive)
 
     # Start scraping
-    success = scraper.scrape_projects()
+    work_queue = WorkQueue(args.queue, lease_seconds=args.lease_seconds,
+                           max_attempts=args.max_attempts) if args.queue else None
+    if args.role == 'coordinator':
+        success = scraper.enqueue_projects(work_queue)
+        work_queue.close()
+        print("✅ Projects queued" if success else "❌ No projects queued. Check scraper.log for details.")
+        return
+    if args.role == 'worker':
+        scraper.work_from_queue(work_queue, args.worker_id)
+        work_queue.close()
+        return
+    if args.role == 'collect':
+        success = scraper.collect_from_queue(work_queue)
+        work_queue.close()
+        scraper.write_to_sinks()
+    elif args.from_html or args.from_archive:
+        success = scraper.scrape_archive() if args.from_archive else scraper.scrape_saved_pages(args.from_html)
+        scraper.selectors.log_summary()
+        scraper.selectors.save()
+        scraper.write_to_sinks()
+    else:
+        success = scraper.scrape_projects()
+    if snapshot_archive:
+        snapshot_archive.log_summary()
+        snapshot_archive.close()
+
+    if success and args.stream:
+        scraper.save_to_excel_from_stream(f"{prefix}.jsonl", f"{prefix}.xlsx")
+
+        print(f"\n🎉 Scraping of {profile.name} completed successfully! {scraper.records_streamed} projects streamed")
+        print(f"📁 Files saved:")
+        print(f"   📊 {prefix}.xlsx")
+        print(f"   📄 {prefix}.csv")
+        print(f"   🔗 {prefix}.jsonl")
+        if args.parquet:
+            print(f"   🧱 {prefix}.parquet")
+        if args.store:
+            print(f"   🗃️ {args.store}")
+        print("   📋 scraper.log")
+    elif success:
+        if not args.no_normalize:
+            scraper.normalize_results()
 
-    if success:
         # Print results with enhanced formatting
         scraper.print_results()
 
         # Save to multiple formats
-        scraper.save_to_excel()
-        scraper.save_to_csv()
-        scraper.save_to_json()
+        scraper.save_to_excel(f"{prefix}.xlsx")
+        scraper.save_to_csv(f"{prefix}.csv")
+        scraper.save_to_json(f"{prefix}.json")
 
-        print(f"\n🎉 Scraping completed successfully!")
+        print(f"\n🎉 Scraping of {profile.name} completed successfully!")
         print(f"📁 Files saved:")
-        print("   📊 odisha_rera_projects_fixed.xlsx")
-        print("   📄 odisha_rera_projects_fixed.csv")
-        print("   🔗 odisha_rera_projects_fixed.json")
+        print(f"   📊 {prefix}.xlsx")
+        print(f"   📄 {prefix}.csv")
+        print(f"   🔗 {prefix}.json")
+        if args.parquet:
+            print(f"   🧱 {prefix}.parquet")
+        if args.store:
+            print(f"   🗃️ {args.store}")
         print("   📋 scraper.log")
     else:
-        print("❌ Scraping failed. Check scraper.log for details.")
+        print(f"❌ Scraping of {profile.name} failed. Check scraper.log for details.")
+
+
+def run_sites(args, profiles, driver_pool, resource_blocker, page_cache, metrics, rate_limiter):
+    """Crawl every portal concurrently; they share browsers, cache, metrics and the per-host rate limiter"""
+    if len(profiles) == 1:
+        run_job(args, driver_pool, resource_blocker, page_cache, metrics, profiles[0], rate_limiter)
+    else:
+        with ThreadPoolExecutor(max_workers=len(profiles)) as executor:
+            futures = {executor.submit(run_job, args, driver_pool, resource_blocker, page_cache, metrics,
+                                       profile, rate_limiter): profile for profile in profiles}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"❌ Crawl of {futures[future].name} failed: {str(e)}")
+
+    if args.metrics_json:
+        metrics.save_json(args.metrics_json)
+
+
+def main():
+    """Main execution function"""
+    args = parse_args()
+
+    print("🚀 FIXED Odisha RERA Projects Scraper")
+    print("=" * 60)
+
+    # One pool for the whole process, so repeated jobs start with warm browser sessions
+    resource_blocker = None
+    if not args.no_block:
+        resource_blocker = ResourceBlocker(resource_types=[t for t in args.block_types.split(',') if t],
+                                           url_patterns=DEFAULT_BLOCKED_URL_PATTERNS + args.block_urls)
+    page_cache = None
+    if args.cache_dir or args.replay:
+        page_cache = PageCache(args.cache_dir or "page_cache", ttl_hours=args.cache_ttl,
+                               max_mb=args.cache_max_mb, replay=args.replay)
+    # Cumulative across repeated jobs, like any Prometheus target
+    metrics = CrawlMetrics()
+    if args.metrics_port:
+        metrics.serve(args.metrics_port)
+    rate_limiter = RateLimiter(args.rate)
+    driver_pool = create_driver_pool(args.chromedriver, resource_blocker, lean=args.lean,
+                                     max_pages=args.session_max_pages, max_memory_mb=args.session_max_memory_mb)
+    try:
+        while True:
+            run_sites(args, args.profiles, driver_pool, resource_blocker, page_cache, metrics, rate_limiter)
+            if not args.repeat_every:
+                break
+            logger.info(f"💤 Next run in {args.repeat_every} minutes")
+            time.sleep(args.repeat_every * 60)
+    except KeyboardInterrupt:
+        logger.info("🛑 Stopped")
+    finally:
+        driver_pool.close()
 
 
 if __name__ == "__main__":
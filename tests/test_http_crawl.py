@@ -0,0 +1,103 @@
+import pytest
+
+from rera_benchmark import MockReraSite, LISTING_PATH
+from rera_scraper import EnhancedOdishaRERAScaper, FIELDS, has_missing_fields
+
+PROJECTS = 12
+PER_PAGE = 5
+
+
+class GstlessSite(MockReraSite):
+    """Mock site whose even-numbered projects have no GST row, as if it only appeared after JavaScript ran"""
+
+    def detail_page(self, number):
+        html = super().detail_page(number)
+        if number % 2 == 0:
+            html = html.replace("<tr><td>GST No</td>", "<tr><td>Remarks</td>")
+        return html
+
+
+@pytest.fixture
+def site():
+    site = MockReraSite(PROJECTS, per_page=PER_PAGE).start()
+    yield site
+    site.stop()
+
+
+@pytest.fixture
+def gstless_site():
+    site = GstlessSite(PROJECTS, per_page=PER_PAGE).start()
+    yield site
+    site.stop()
+
+
+def make_scraper(site, fetch_mode='http', **options):
+    scraper = EnhancedOdishaRERAScaper("chromedriver", fetch_mode=fetch_mode, max_projects=0, rate_limit=0,
+                                       **options)
+    scraper.base_url = site.base_url + LISTING_PATH
+    return scraper
+
+
+def test_http_mode_extracts_every_project(site):
+    scraper = make_scraper(site)
+
+    assert scraper.scrape_projects()
+
+    assert len(scraper.projects_data) == PROJECTS
+    for number, record in enumerate(scraper.projects_data, 1):
+        assert list(record) == FIELDS
+        assert record['Rera Regd. No'] == site.rera_number(number)
+        assert record['Promoter Name'] == f"M/S. BENCH{number} INFRA PVT LTD"
+        assert record['Address of the Promoter'] == f"Plot {number}, Saheed Nagar, Bhubaneswar, PIN-751007"
+        assert record['GST No'] == f"21AAACB{number:04d}A1Z{number % 10}"
+        assert not has_missing_fields(record)
+
+
+def test_http_mode_follows_pagination(site):
+    scraper = make_scraper(site)
+
+    assert scraper.scrape_projects()
+
+    pages = [project['page'] for project in scraper.harvested_projects]
+    assert pages == [1] * 5 + [2] * 5 + [3] * 2
+    # Three listing pages plus one detail page per project, nothing fetched twice
+    assert site.requests == 3 + PROJECTS
+
+
+def test_page_range_stops_at_end_page(site):
+    scraper = make_scraper(site, start_page=2, end_page=2)
+
+    assert scraper.scrape_projects()
+
+    assert [record['Rera Regd. No'] for record in scraper.projects_data] == \
+        [site.rera_number(number) for number in range(6, 11)]
+
+
+def test_auto_mode_sends_incomplete_projects_to_the_browser(gstless_site):
+    scraper = make_scraper(gstless_site, fetch_mode='auto')
+    sent = []
+
+    def browser(positions=None):
+        sent.extend(positions)
+        for i in positions:
+            scraper.projects_data[i] = dict(scraper.projects_data[i], **{'GST No': 'FROM-BROWSER'})
+        return True
+
+    scraper.scrape_projects_with_browser = browser
+
+    assert scraper.scrape_projects()
+
+    assert sent == [i for i in range(PROJECTS) if (i + 1) % 2 == 0]
+    assert all(not has_missing_fields(record) for record in scraper.projects_data)
+    assert [record['GST No'] == 'FROM-BROWSER' for record in scraper.projects_data] == \
+        [(i + 1) % 2 == 0 for i in range(PROJECTS)]
+
+
+def test_http_mode_never_falls_back(gstless_site):
+    scraper = make_scraper(gstless_site)
+    scraper.scrape_projects_with_browser = lambda positions=None: pytest.fail("browser fallback in http mode")
+
+    assert scraper.scrape_projects()
+
+    assert [record['GST No'] == 'Not Available' for record in scraper.projects_data] == \
+        [(i + 1) % 2 == 0 for i in range(PROJECTS)]
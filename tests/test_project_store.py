@@ -0,0 +1,44 @@
+import sqlite3
+
+from rera_scraper import ProjectStore
+
+RICH = {'Rera Regd. No': 'RP/01/2025/00001', 'Project Name': 'Enclave', 'Promoter Name': 'M/S. BENCH1 INFRA PVT LTD',
+        'Address of the Promoter': 'Plot 1, Saheed Nagar', 'GST No': 'Not Available'}
+SPARSE = {'Rera Regd. No': 'RP/01/2025/00001', 'Project Name': 'Not Available', 'Promoter Name': 'Not Available',
+          'Address of the Promoter': 'Not Available', 'GST No': 'Not Available'}
+COMPLETE = dict(RICH, **{'GST No': '21AAACB0001A1Z1'})
+
+
+def stored(path):
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT project_name, gst_number, filled FROM projects").fetchall()
+
+
+def test_sparse_record_does_not_replace_a_richer_one(tmp_path):
+    path = str(tmp_path / 'projects.db')
+    store = ProjectStore(path, batch_size=1)
+    store.write(RICH)
+    store.write(SPARSE)
+    store.close()
+
+    assert stored(path) == [('Enclave', None, 4)]
+
+
+def test_more_complete_record_replaces_a_stored_one(tmp_path):
+    path = str(tmp_path / 'projects.db')
+    store = ProjectStore(path, batch_size=1)
+    store.write(RICH)
+    store.write(COMPLETE)
+    store.close()
+
+    assert stored(path) == [('Enclave', '21AAACB0001A1Z1', 5)]
+
+
+def test_most_complete_record_wins_within_a_batch(tmp_path):
+    path = str(tmp_path / 'projects.db')
+    store = ProjectStore(path)
+    store.write(RICH)
+    store.write(SPARSE)
+    store.close()
+
+    assert stored(path) == [('Enclave', None, 4)]
@@ -0,0 +1,32 @@
+import pytest
+
+from rera_scraper import ODISHA_PROJECT_NAMES, SiteProfile, load_site_profile
+
+
+def test_file_profile_does_not_inherit_odisha_settings():
+    profile = SiteProfile.from_dict({'name': 'maharashtra', 'base_url': 'https://example.invalid/projects'})
+
+    assert profile.output_prefix == 'maharashtra_rera_projects'
+    assert not any(name in selector for name in ODISHA_PROJECT_NAMES
+                   for selector in profile.field_selectors['Project Name'])
+    assert profile.path_for('selector_stats.json') == 'selector_stats.maharashtra.json'
+
+
+def test_builtin_odisha_profile_keeps_its_names_and_paths():
+    profile = load_site_profile('odisha')
+
+    assert profile.base_url.startswith('https://rera.odisha.gov.in/')
+    assert any('UDYAYEEN' in selector for selector in profile.field_selectors['Project Name'])
+    assert profile.path_for('selector_stats.json') == 'selector_stats.json'
+
+
+@pytest.mark.parametrize('data', [{'base_url': 'https://example.invalid/'}, {'name': 'maharashtra'}])
+def test_file_profile_requires_name_and_base_url(data):
+    with pytest.raises(ValueError):
+        SiteProfile.from_dict(data)
+
+
+@pytest.mark.parametrize('key', ['path_for', 'load', 'selectors', 'SETTINGS'])
+def test_profile_keys_cannot_replace_methods(key):
+    with pytest.raises(ValueError, match='Unknown site profile setting'):
+        SiteProfile.from_dict({'name': 'maharashtra', 'base_url': 'https://example.invalid/', key: 'x'})
@@ -0,0 +1,29 @@
+from rera_scraper import WorkQueue
+
+
+def test_project_that_keeps_losing_its_lease_is_failed(tmp_path):
+    # Leases that are already expired stand in for a worker killed mid-project
+    queue = WorkQueue(str(tmp_path / 'queue.db'), lease_seconds=-1, max_attempts=3)
+    queue.push({'id': 'p1', 'url': 'http://example.invalid/1'})
+
+    claims = [queue.claim('worker') for _ in range(5)]
+
+    assert [claim is not None for claim in claims] == [True, True, True, False, False]
+    assert queue.counts() == {'failed': 1}
+    assert queue.outstanding() == 0
+    queue.close()
+
+
+def test_failed_attempts_return_a_project_until_they_run_out(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), max_attempts=2)
+    queue.push({'id': 'p1', 'url': 'http://example.invalid/1'})
+
+    position, _ = queue.claim('worker')
+    queue.fail(position)
+    assert queue.counts() == {'pending': 1}
+
+    position, _ = queue.claim('worker')
+    queue.fail(position)
+    assert queue.counts() == {'failed': 1}
+    assert queue.claim('worker') is None
+    queue.close()